@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Offline benchmark for the scraper's parse/rank hot path.
+#
+# Uses page_debug.html as the fixture plus synthetic pages that repeat its
+# tables and rows, times each stage and records peak memory:
+#   python bench_ranking_scrapper.py --save-baseline bench_baseline.json
+#   python bench_ranking_scrapper.py --compare bench_baseline.json
+import io
+import re
+import gc
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from bs4 import BeautifulSoup
+import pandas as pd
+import ranking_scrapper as rs
+
+_TBODY = re.compile(r"(<tbody[^>]*>)(.*?)(</tbody>)", re.IGNORECASE | re.DOTALL)
+
+# Synthetic page: every table's body rows repeated rows_scale times,
+# and the whole set of tables repeated tables_scale times
+def synthesize_page(html, tables_scale=1, rows_scale=1):
+    fragments = list(rs.table_fragments(html))
+    if rows_scale > 1:
+        fragments = [
+            _TBODY.sub(lambda m: m.group(1) + m.group(2) * rows_scale + m.group(3), fragment)
+            for fragment in fragments
+        ]
+    body = "\n".join(fragments * tables_scale)
+    return f"<html><head><title>bench</title></head><body>{body}</body></html>"
+
+# Run fn repeat times, return (best seconds, result of the last run)
+def _time(fn, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+# Peak traced allocation of one run of fn, in bytes
+def _peak(fn):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# Time every stage for one page and report throughput
+def bench_page(html, repeat=5):
+    def full_soup():
+        return BeautifulSoup(html, "html.parser")
+
+    def strained_soup():
+        return BeautifulSoup(html, rs.HTML_PARSER, parse_only=rs.TABLE_STRAINER)
+
+    soup = full_soup()
+    tables = soup.find_all("table")
+
+    def rank_all():
+        return [rs.parse_and_rank_table(table, idx) for idx, table in enumerate(tables)]
+
+    ranked = [df for df in rank_all() if not df.empty]
+
+    def concat():
+        return rs.concat_ranked(ranked)
+
+    combined = concat()
+
+    def write_csv():
+        buffer = io.StringIO()
+        combined.to_csv(buffer, index=False)
+        return buffer
+
+    stages = {
+        "soup_html_parser": full_soup,
+        "soup_strained": strained_soup,
+        "find_all_tables": lambda: soup.find_all("table"),
+        "parse_and_rank": rank_all,
+        "concat": concat,
+        "to_csv": write_csv,
+        "end_to_end": lambda: rs.parse_html_tables(html),
+    }
+    n_tables = len(tables)
+    n_rows = len(combined)
+    results = {}
+    for name, fn in stages.items():
+        seconds, _ = _time(fn, repeat)
+        results[name] = {
+            "seconds": seconds,
+            "tables_per_s": n_tables / seconds if seconds else None,
+            "rows_per_s": n_rows / seconds if seconds else None,
+            "peak_bytes": _peak(fn),
+        }
+    results["parse_and_rank"]["per_table_seconds"] = results["parse_and_rank"]["seconds"] / max(n_tables, 1)
+    return {"html_bytes": len(html), "tables": n_tables, "rows": n_rows, "stages": results}
+
+def run(fixture, scales, repeat):
+    with open(fixture, encoding="utf-8") as f:
+        html = f.read()
+    report = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "parser": rs.HTML_PARSER,
+        "fixture": fixture,
+        "cases": {},
+    }
+    for tables_scale, rows_scale in scales:
+        case = f"tables_x{tables_scale}_rows_x{rows_scale}"
+        page = html if (tables_scale, rows_scale) == (1, 1) else synthesize_page(html, tables_scale, rows_scale)
+        report["cases"][case] = bench_page(page, repeat)
+    return report
+
+def print_report(report, baseline=None):
+    for case, result in report["cases"].items():
+        print(f"\n{case}: {result['html_bytes'] / 1024:.0f} KiB, {result['tables']} tables, {result['rows']} rows")
+        print(f"  {'stage':<18}{'ms':>10}{'tables/s':>12}{'rows/s':>12}{'peak KiB':>11}{'vs base':>9}")
+        for stage, r in result["stages"].items():
+            line = (f"  {stage:<18}{r['seconds'] * 1000:>10.2f}{r['tables_per_s'] or 0:>12.0f}"
+                    f"{r['rows_per_s'] or 0:>12.0f}{r['peak_bytes'] / 1024:>11.0f}")
+            base = (baseline or {}).get("cases", {}).get(case, {}).get("stages", {}).get(stage)
+            if base:
+                line += f"{r['seconds'] / base['seconds']:>8.2f}x"
+            print(line)
+
+def parse_scales(text):
+    scales = []
+    for item in text.split(","):
+        tables_scale, _, rows_scale = item.partition("x")
+        scales.append((int(tables_scale), int(rows_scale or 1)))
+    return scales
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scraper parse/rank path offline.")
+    parser.add_argument("--fixture", default=rs.DEBUG_HTML)
+    parser.add_argument("--scales", default="1x1,10x1,1x20,10x20",
+                        help="comma-separated TABLESxROWS multipliers for synthetic pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="show timings relative to a saved baseline")
+    args = parser.parse_args()
+
+    report = run(args.fixture, parse_scales(args.scales), args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
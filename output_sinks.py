@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+import os
+import json
+import logging
+from datetime import datetime, timezone
+import pandas as pd
+
+# pyarrow is only needed for the columnar sinks
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+PARTITION_COLUMNS = ("league", "date", "table_index")
+SINK_KINDS = ("csv", "parquet", "arrow")
+
+def _require_pyarrow(kind):
+    if pa is None:
+        raise RuntimeError(f"The {kind} sink needs pyarrow (pip install pyarrow)")
+
+def _run_stamp():
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+# Sidecar next to each output recording the result it holds, {source: digest}.
+# Every write replaces it, a write without a manifest removes it.
+def _manifest_path(path):
+    return os.path.normpath(path) + ".manifest.json"
+
+def _read_manifest(path):
+    try:
+        with open(_manifest_path(path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _record_manifest(path, manifest):
+    if manifest is None:
+        if os.path.exists(_manifest_path(path)):
+            os.remove(_manifest_path(path))
+        return
+    with open(_manifest_path(path), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+# Plain CSV, kept for consumers that still expect all_tables_ranked.csv
+class CsvSink:
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def holds(self, manifest):
+        return self.exists() and _read_manifest(self.path) == manifest
+
+    def write(self, df, manifest=None):
+        if self.append and self.exists():
+            df.to_csv(self.path, mode="a", header=False, index=False)
+        else:
+            df.to_csv(self.path, index=False)
+        _record_manifest(self.path, manifest)
+        logging.info("Saved CSV %s", self.path)
+
+# Hive-partitioned Parquet dataset (league=/date=/table_index=).
+# Every write adds new files, so scheduled runs append without rewriting
+# history; append=False clears the partitions being written first.
+class ParquetSink:
+    def __init__(self, root, append=True, partition_cols=PARTITION_COLUMNS):
+        _require_pyarrow("parquet")
+        self.root = root
+        self.append = append
+        self.partition_cols = list(partition_cols)
+
+    def exists(self):
+        return os.path.isdir(self.root) and any(os.scandir(self.root))
+
+    def holds(self, manifest):
+        return self.exists() and _read_manifest(self.root) == manifest
+
+    def write(self, df, manifest=None):
+        df = df.copy()
+        if "date" in self.partition_cols and "date" not in df:
+            df["date"] = datetime.now(timezone.utc).date().isoformat()
+        if "league" in self.partition_cols and "league" not in df:
+            df["league"] = "unknown"
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_to_dataset(
+            table,
+            self.root,
+            partition_cols=self.partition_cols,
+            basename_template=f"part-{_run_stamp()}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore" if self.append else "delete_matching",
+        )
+        _record_manifest(self.root, manifest)
+        logging.info("Saved Parquet dataset %s", self.root)
+
+# Arrow IPC (Feather v2) files that readers can memory-map without copying.
+# With append=True the path is a directory and every write adds one file.
+class ArrowIpcSink:
+    def __init__(self, path, append=False):
+        _require_pyarrow("arrow")
+        self.path = path
+        self.append = append
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def holds(self, manifest):
+        return self.exists() and _read_manifest(self.path) == manifest
+
+    def write(self, df, manifest=None):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        path = self.path
+        if self.append:
+            os.makedirs(self.path, exist_ok=True)
+            path = os.path.join(self.path, f"part-{_run_stamp()}.arrow")
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        _record_manifest(self.path, manifest)
+        logging.info("Saved Arrow IPC %s", path)
+
+# Memory-map an Arrow IPC file (or a directory of them) back into a DataFrame
+def read_arrow_ipc(path):
+    paths = [path]
+    if os.path.isdir(path):
+        paths = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".arrow"))
+    tables = [pa.ipc.open_file(pa.memory_map(p, "r")).read_all() for p in paths]
+    return pa.concat_tables(tables).to_pandas() if tables else pd.DataFrame()
+
+# Build a sink from "kind:path", e.g. "parquet:standings_parquet"
+def make_sink(spec, append=False):
+    kind, sep, path = spec.partition(":")
+    if not sep:
+        kind, path = os.path.splitext(spec)[1].lstrip(".") or "csv", spec
+    if kind == "csv":
+        return CsvSink(path, append=append)
+    if kind == "parquet":
+        return ParquetSink(path, append=append)
+    if kind in ("arrow", "ipc", "feather"):
+        return ArrowIpcSink(path, append=append)
+    raise ValueError(f"Unknown sink {kind!r}, expected one of {SINK_KINDS}")
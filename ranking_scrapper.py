@@ -1,12 +1,48 @@
 #!/usr/bin/env python3
+import os
+import re
+import glob
 import time
+import pickle
+import hashlib
+import queue
+import asyncio
 import logging
-from bs4 import BeautifulSoup
+import argparse
+import threading
+from collections import namedtuple, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
 import pandas as pd
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
+from playwright.async_api import async_playwright
+from snapshot_archive import SnapshotArchive, ARCHIVE_DIR
+from scrape_metrics import METRICS
+from output_sinks import CsvSink, make_sink
+from standings_store import StandingsStore, STANDINGS_DB, changes_to_json, rank_moves
+
+# requests powers the lightweight HTTP tier; without it every URL uses Chromium
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# lxml is much faster than the stdlib parser; fall back when it isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 URL = "https://cricclubs.com/FortyPlusLeague/viewPointsTable.do?league=19&clubId=24301"
+URL_TEMPLATE = "https://cricclubs.com/{site}/viewPointsTable.do?league={league}&clubId={club_id}"
 DEBUG_HTML = "page_debug.html"
+SNAPSHOT_SUFFIXES = (".html", ".htm")
+PARALLEL_UNITS = ("snapshot", "table")
+DEFAULT_CHUNKSIZE = 8
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -14,113 +50,1230 @@ DEFAULT_USER_AGENT = (
 )
 DEFAULT_VIEWPORT = {"width": 1280, "height": 800}
 DEFAULT_TIMEOUT_MS = 120000
+MIN_TIMEOUT_MS = 15000
+MAX_TIMEOUT_MS = DEFAULT_TIMEOUT_MS  # hard upper bound, adaptive timeouts never exceed it
+TIMEOUT_FACTOR = 3.0
+TIMEOUT_WINDOW = 20
+
+# Readiness strategies for a loaded page:
+#   selector    - a <table> element is attached
+#   stable_rows - a table is attached and the row count stopped changing
+#   networkidle - no network activity for 500 ms
+#   sleep       - the old fixed wait
+READY_STRATEGIES = ("selector", "stable_rows", "networkidle", "sleep")
+DEFAULT_READY_STRATEGY = "stable_rows"
+READY_SELECTOR = "table"
+ROW_COUNT_JS = "() => document.querySelectorAll('table tr').length"
+STABLE_POLL_S = 0.25
+STABLE_ROUNDS = 3
+LEGACY_SLEEP_S = 5
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CONCURRENCY = 4
+DEFAULT_URL_TIMEOUT_S = 150
+LAUNCH_RETRY_S = 60  # how long a failed Chromium launch is remembered before trying again
+
+# Request interception: the tables only need the document, its scripts and
+# the XHRs that fill them. Allow-list patterns win over everything else.
+BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet", "manifest", "texttrack", "beacon")
+BLOCKED_URL_PATTERNS = (
+    r"google-analytics\.com", r"googletagmanager\.com", r"doubleclick\.net",
+    r"googlesyndication\.com", r"adservice\.google", r"amazon-adsystem\.com",
+    r"facebook\.(net|com)/.*(tr|sdk)", r"hotjar\.com", r"clarity\.ms", r"/ads?/",
+)
+ALLOWED_URL_PATTERNS = (r"cricclubs\.com/[^?]*\.do",)
+# Rough transfer sizes used to estimate what blocked requests would have cost
+TYPICAL_RESOURCE_BYTES = {
+    "image": 40_000, "media": 500_000, "font": 60_000, "stylesheet": 30_000,
+    "script": 80_000, "xhr": 5_000, "fetch": 5_000, "other": 10_000,
+}
+
+# HTTP tier: pooled keep-alive client tried before Chromium
+HTTP_TIMEOUT_S = 15
+HTTP_POOL_SIZE = 10
+HTTP_HEADERS = {
+    "User-Agent": DEFAULT_USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# One finished page from the async scraper
+PageResult = namedtuple("PageResult", ["url", "html", "df", "cached", "tier"])
+
+# Ranked-result cache: keyed by URL, invalidated by the table content hash
+CACHE_DIR = ".scrape_cache"
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_AGE_S = 7 * 24 * 3600
+# Bump when parsing/ranking output changes so older cache entries stop matching
+RANKING_VERSION = 2
 
 # Convert string to number
 def text_to_number(s):
     try:
         return float(s)
-    except:
+    except (TypeError, ValueError):
         return None
 
-# Parse a table and compute ranking
-def parse_and_rank_table(table, table_index):
+# Build a points-table URL from a league/clubId pair
+def league_url(league, club_id, site="FortyPlusLeague"):
+    return URL_TEMPLATE.format(site=site, league=league, club_id=club_id)
+
+# Stable league identifier for a points-table URL, e.g. "FortyPlusLeague:19:24301"
+def league_key(url):
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if "league" not in query:
+        return url
+    site = parts.path.strip("/").split("/")[0]
+    return ":".join([site, query["league"][0], query.get("clubId", [""])[0]])
+
+# Accept plain URLs or (league, clubId) pairs
+def normalize_targets(targets):
+    urls = []
+    for target in targets:
+        if isinstance(target, str):
+            urls.append(target)
+        else:
+            urls.append(league_url(*target))
+    return urls
+
+# Text of the header/data cells directly under a row
+def _row_texts(tr):
+    return [cell.get_text(strip=True) for cell in tr.find_all(("td", "th"), recursive=False)]
+
+# Coerce a text column to float32 in one vectorized pass, unparsable cells become NaN
+def _numeric_column(values):
+    return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float32)
+
+# Resolved column positions for one header layout; points/won/nrr may be None
+TableSchema = namedtuple("TableSchema", ["team", "points", "won", "nrr", "width"])
+
+# Header cells normalized for matching: lowercase, single spaces
+def header_fingerprint(headers):
+    return tuple(" ".join(header.lower().split()) for header in headers)
+
+# Substring heuristics for a layout nobody registered
+def _guess_schema(headers):
+    return TableSchema(
+        team=next((i for i, c in enumerate(headers) if "team" in c or "club" in c), 0),
+        points=next((i for i, c in enumerate(headers) if "point" in c or c in ("p", "pt")), None),
+        won=next((i for i, c in enumerate(headers) if "won" in c), None),
+        nrr=next((i for i, c in enumerate(headers) if "nrr" in c), None),
+        width=len(headers),
+    )
+
+# Header layout -> column positions.
+# Layouts are keyed by their header fingerprint; registered layouts map
+# straight to a schema, unknown ones go through the heuristics once, are
+# logged once, and the guess is memoized for every later table.
+class SchemaRegistry:
+    def __init__(self):
+        self._schemas = {}
+        self._lock = threading.Lock()
+
+    # Register a layout; columns are given by header name or position
+    def register(self, headers, team, points=None, won=None, nrr=None):
+        fingerprint = header_fingerprint(headers)
+
+        def position(column):
+            if column is None or isinstance(column, int):
+                return column
+            return fingerprint.index(header_fingerprint([column])[0])
+
+        schema = TableSchema(position(team), position(points), position(won), position(nrr), len(fingerprint))
+        with self._lock:
+            self._schemas[fingerprint] = schema
+        return schema
+
+    def resolve(self, headers):
+        fingerprint = header_fingerprint(headers)
+        schema = self._schemas.get(fingerprint)
+        if schema is not None:
+            return schema
+        with self._lock:
+            schema = self._schemas.get(fingerprint)
+            if schema is None:
+                schema = self._schemas[fingerprint] = _guess_schema(fingerprint)
+                logging.info("Unregistered table layout %s, guessed %s", list(fingerprint), schema)
+        return schema
+
+SCHEMAS = SchemaRegistry()
+# CricClubs points table
+SCHEMAS.register(
+    ["#", "team", "mat", "won", "lost", "n/r", "tie", "pts", "win %", "net rr", "for", "against"],
+    team="team", points="pts", won="won", nrr="net rr",
+)
+
+# Parse a table and compute ranking.
+# Column positions come from the schema registry, so only the team, points,
+# won and nrr cells are collected; CricClubs renders body cells as <th>, so
+# both <td> and <th> are read.
+def parse_and_rank_table(table, table_index, schemas=SCHEMAS):
     headers = []
     thead = table.find("thead")
     if thead:
-        headers = [th.get_text(strip=True).lower() for th in thead.find_all("th")]
+        headers = [th.get_text(strip=True) for th in thead.find_all("th")]
     else:
         first_row = table.find("tr")
         if first_row:
-            headers = [td.get_text(strip=True).lower() for td in first_row.find_all("td")]
+            headers = _row_texts(first_row)
+
+    if not headers:
+        return pd.DataFrame()
 
-    rows_data = []
+    schema = schemas.resolve(headers)
+    wanted = {i for i in (schema.team, schema.points, schema.won, schema.nrr) if i is not None}
+    columns = {i: [] for i in wanted}
     for tr in table.find_all("tr")[1:]:
-        cells = [td.get_text(strip=True) for td in tr.find_all("td")]
-        if len(cells) < len(headers):
+        cells = _row_texts(tr)
+        if len(cells) < schema.width:
             continue
-        row = dict(zip(headers, cells))
-        rows_data.append(row)
+        for i, column in columns.items():
+            column.append(cells[i])
 
-    if not rows_data:
+    n_rows = len(columns[schema.team])
+    if not n_rows:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows_data)
+    zeros = np.zeros(n_rows, dtype=np.float32)
+    points = _numeric_column(columns[schema.points]) if schema.points is not None else zeros
+    won = _numeric_column(columns[schema.won]) if schema.won is not None else zeros
+    nrr = _numeric_column(columns[schema.nrr]) if schema.nrr is not None else zeros
 
-    # Heuristic: find columns
-    col_team = next((c for c in df.columns if "team" in c or "club" in c), df.columns[0])
-    col_points = next((c for c in df.columns if "point" in c or c in ("p", "pt")), None)
-    col_won = next((c for c in df.columns if "won" in c), None)
-    col_nrr = next((c for c in df.columns if "nrr" in c), None)
+    # Rank: points, then nrr, then won, all descending (lexsort's primary key is last)
+    order = np.lexsort((-won, -nrr, -points))
 
-    # Coerce numeric
-    if col_points:
-        df["_points"] = df[col_points].apply(text_to_number)
-    else:
-        df["_points"] = 0
-    if col_won:
-        df["_won"] = df[col_won].apply(text_to_number)
+    return pd.DataFrame({
+        "table_index": np.full(n_rows, table_index, dtype=np.int32),
+        "rank": np.arange(1, n_rows + 1, dtype=np.int32),
+        "team": pd.Categorical(np.asarray(columns[schema.team], dtype=object)[order]),
+        "points": points[order],
+        "nrr": nrr[order],
+        "won": won[order],
+    })
+
+# Concatenate ranked frames, keeping team as a single categorical
+def concat_ranked(dfs):
+    combined_df = pd.concat(dfs, ignore_index=True)
+    if "team" in combined_df:
+        combined_df["team"] = combined_df["team"].astype("category")
+    return combined_df
+
+# Only build trees for <table> elements, the rest of the page is skipped
+TABLE_STRAINER = SoupStrainer("table")
+
+# Pull the <table> elements out of a page without building a full-document soup
+def extract_tables(html):
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=TABLE_STRAINER)
+    return soup.find_all("table")
+
+# Parse every table in a rendered page
+def parse_html_tables(html):
+    with METRICS.stage("parse", bytes=len(html)) as stage:
+        tables = extract_tables(html)
+        stage["tables"] = len(tables)
+
+    with METRICS.stage("rank") as stage:
+        all_dfs = []
+        for idx, table in enumerate(tables):
+            df_table = parse_and_rank_table(table, idx)
+            if not df_table.empty:
+                all_dfs.append(df_table)
+
+        combined_df = concat_ranked(all_dfs) if all_dfs else pd.DataFrame()
+        stage["tables"] = len(all_dfs)
+        stage["rows"] = len(combined_df)
+    return combined_df
+
+_TABLE_TAG = re.compile(r"<(/?)table\b[^>]*>", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+# Raw HTML of each top-level <table>, found by tag matching without building a soup
+def table_fragments(html):
+    depth, start = 0, 0
+    for match in _TABLE_TAG.finditer(html):
+        if not match.group(1):
+            if not depth:
+                start = match.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if not depth:
+                yield html[start:match.end()]
+
+# Whitespace-normalized content hash of a page's tables
+def table_digest(html):
+    digest = hashlib.sha256(f"v{RANKING_VERSION}\0".encode("ascii"))
+    for fragment in table_fragments(html):
+        digest.update(_WHITESPACE.sub(" ", fragment).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+# On-disk cache of ranked frames, one pickle per URL.
+# Entries older than max_age_s are dropped, and beyond max_entries the least
+# recently used ones go first (a hit refreshes the file's mtime).
+class ResultCache:
+    def __init__(self, directory=CACHE_DIR, max_entries=CACHE_MAX_ENTRIES, max_age_s=CACHE_MAX_AGE_S):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_age_s = max_age_s
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".pkl")
+
+    def get(self, url, digest):
+        path = self._path(url)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            expired = time.time() - entry["stored_at"] > self.max_age_s
+            matches = entry["url"] == url and entry["digest"] == digest
+            df = entry["df"]
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # Truncated, foreign or pickled by another pandas: a miss, never an error
+            logging.info("Dropping unreadable cache entry for %s: %s", url, exc)
+            self._remove(path)
+            return None
+        if expired:
+            self._remove(path)
+            return None
+        if not matches:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted by another thread meanwhile, the frame is still good
+        return df
+
+    def put(self, url, digest, df):
+        path = self._path(url)
+        entry = {"url": url, "digest": digest, "stored_at": time.time(), "df": df}
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".pkl"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+            entries.sort(reverse=True)
+            cutoff = time.time() - self.max_age_s
+            for position, (mtime, path) in enumerate(entries):
+                if position >= self.max_entries or mtime < cutoff:
+                    self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# Parse and rank a page, reusing the cached frame when its tables are unchanged.
+# Returns (df, cached).
+def rank_html(html, url=None, cache=None):
+    if cache is None or url is None:
+        return parse_html_tables(html), False
+
+    with METRICS.stage("cache_lookup", url=url) as stage:
+        digest = table_digest(html)
+        df = cache.get(url, digest)
+        stage["hit"] = df is not None
+    if df is not None:
+        logging.info("Tables unchanged on %s, using cached ranking", url)
+        return df, True
+
+    df = parse_html_tables(html)
+    if not df.empty:
+        cache.put(url, digest, df)
+    return df, False
+
+# Expand a snapshot file, directory or glob into sorted file paths
+def iter_snapshot_paths(source):
+    if os.path.isfile(source):
+        yield source
+    elif os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(SNAPSHOT_SUFFIXES):
+                    yield os.path.join(root, name)
     else:
-        df["_won"] = 0
-    if col_nrr:
-        df["_nrr"] = df[col_nrr].apply(text_to_number)
+        for path in sorted(glob.glob(source, recursive=True)):
+            if os.path.isfile(path):
+                yield path
+
+# Offline mode: parse saved HTML snapshots one at a time, no browser needed
+def iter_snapshot_tables(source):
+    for path in iter_snapshot_paths(source):
+        with open(path, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        df = parse_html_tables(html)
+        if df.empty:
+            logging.warning("No tables parsed from %s", path)
+        yield path, df
+
+# Offline mode, combined into one frame with a source_path column
+def parse_snapshots(source):
+    all_dfs = [df.assign(source_path=path) for path, df in iter_snapshot_tables(source) if not df.empty]
+    if not all_dfs:
+        logging.error("No tables parsed successfully.")
+        return pd.DataFrame()
+    combined_df = concat_ranked(all_dfs)
+    return combined_df[["source_path"] + [c for c in combined_df.columns if c != "source_path"]]
+
+# Offline mode over the snapshot archive: (url, fetched_at, df) per snapshot,
+# decompressing one snapshot at a time
+def iter_archive_tables(archive, url=None, since=None, until=None, latest_only=False):
+    for snapshot_url, fetched_at, html in archive.iter_snapshots(url, since, until, latest_only):
+        df = parse_html_tables(html)
+        if df.empty:
+            logging.warning("No tables parsed from %s at %s", snapshot_url, fetched_at)
+        yield snapshot_url, fetched_at, df
+
+# Archive offline mode, combined with source_url and fetched_at columns
+def parse_archive(archive, url=None, since=None, until=None, latest_only=False):
+    all_dfs = [
+        df.assign(source_url=snapshot_url, fetched_at=fetched_at)
+        for snapshot_url, fetched_at, df in iter_archive_tables(archive, url, since, until, latest_only)
+        if not df.empty
+    ]
+    if not all_dfs:
+        logging.error("No tables parsed successfully.")
+        return pd.DataFrame()
+    combined_df = concat_ranked(all_dfs)
+    leading = ["source_url", "fetched_at"]
+    return combined_df[leading + [c for c in combined_df.columns if c not in leading]]
+
+# Ranked frame -> plain numpy columns, so workers return compact arrays
+# instead of pickled soups or DataFrames
+def _to_columns(df):
+    if df.empty:
+        return None
+    return {
+        "table_index": df["table_index"].to_numpy(),
+        "rank": df["rank"].to_numpy(),
+        "team_codes": df["team"].cat.codes.to_numpy(),
+        "team_categories": df["team"].cat.categories.to_numpy(dtype=object),
+        "points": df["points"].to_numpy(),
+        "nrr": df["nrr"].to_numpy(),
+        "won": df["won"].to_numpy(),
+    }
+
+def _from_columns(columns):
+    return pd.DataFrame({
+        "table_index": columns["table_index"],
+        "rank": columns["rank"],
+        "team": pd.Categorical.from_codes(columns["team_codes"], columns["team_categories"]),
+        "points": columns["points"],
+        "nrr": columns["nrr"],
+        "won": columns["won"],
+    })
+
+def _read_snapshot(path):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+# Worker: parse and rank a whole snapshot
+def _parse_snapshot_columns(path):
+    return path, _to_columns(parse_html_tables(_read_snapshot(path)))
+
+# Worker: parse and rank one top-level table fragment; nested tables keep the
+# indices they would get when the whole page is parsed
+def _parse_fragment_columns(job):
+    path, first_index, fragment = job
+    dfs = [parse_and_rank_table(table, first_index + i) for i, table in enumerate(extract_tables(fragment))]
+    dfs = [df for df in dfs if not df.empty]
+    return path, _to_columns(concat_ranked(dfs)) if dfs else None
+
+# Split snapshots into (path, first table index, fragment) jobs without building soups
+def _iter_fragment_jobs(source):
+    for path in iter_snapshot_paths(source):
+        next_index = 0
+        for fragment in table_fragments(_read_snapshot(path)):
+            yield path, next_index, fragment
+            next_index += sum(1 for match in _TABLE_TAG.finditer(fragment) if not match.group(1))
+
+# Parallel offline mode: fan snapshots (or single tables) out to a process pool
+# and merge the columnar results in input order. Same output as parse_snapshots().
+def parse_snapshots_parallel(source, workers=None, chunksize=DEFAULT_CHUNKSIZE, unit="snapshot"):
+    if unit not in PARALLEL_UNITS:
+        raise ValueError(f"Unknown parallel unit {unit!r}, expected one of {PARALLEL_UNITS}")
+    if unit == "snapshot":
+        worker, jobs = _parse_snapshot_columns, iter_snapshot_paths(source)
     else:
-        df["_nrr"] = 0
+        worker, jobs = _parse_fragment_columns, _iter_fragment_jobs(source)
 
-    df["_team"] = df[col_team].astype(str)
+    by_path = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, columns in pool.map(worker, jobs, chunksize=max(1, chunksize)):
+            parts = by_path.setdefault(path, [])
+            if columns is not None:
+                parts.append(_from_columns(columns))
 
-    # Rank
-    df = df.sort_values(by=["_points", "_nrr", "_won"], ascending=[False, False, False]).reset_index(drop=True)
-    df["rank"] = df.index + 1
+    all_dfs = []
+    for path, parts in by_path.items():
+        if not parts:
+            logging.warning("No tables parsed from %s", path)
+            continue
+        all_dfs.append(concat_ranked(parts).assign(source_path=path))
+    if not all_dfs:
+        logging.error("No tables parsed successfully.")
+        return pd.DataFrame()
+    combined_df = concat_ranked(all_dfs)
+    return combined_df[["source_path"] + [c for c in combined_df.columns if c != "source_path"]]
 
-    # Add table identifier
-    df["table_index"] = table_index
+# Per-host page timeouts that adapt to observed load times.
+# The timeout for a host is TIMEOUT_FACTOR x the slowest recent load,
+# clamped to [MIN_TIMEOUT_MS, MAX_TIMEOUT_MS].
+class AdaptiveTimeout:
+    def __init__(self, initial_ms=DEFAULT_TIMEOUT_MS, min_ms=MIN_TIMEOUT_MS,
+                 max_ms=MAX_TIMEOUT_MS, factor=TIMEOUT_FACTOR, window=TIMEOUT_WINDOW):
+        self.initial_ms = min(initial_ms, max_ms)
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.factor = factor
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
 
-    return df[["table_index", "rank", "_team", "_points", "_nrr", "_won"]].rename(
-        columns={"_team": "team", "_points": "points", "_nrr": "nrr", "_won": "won"}
-    )
+    def timeout_ms(self, url):
+        with self._lock:
+            samples = self._samples.get(urlsplit(url).netloc)
+            if not samples:
+                return self.initial_ms
+            return int(min(self.max_ms, max(self.min_ms, max(samples) * self.factor)))
 
-# Main scraping
-def scrape_multiple_tables(url, headless=True):
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
-        context = browser.new_context(user_agent=DEFAULT_USER_AGENT, viewport=DEFAULT_VIEWPORT)
-        page = context.new_page()
+    def record(self, url, elapsed_ms):
+        with self._lock:
+            host = urlsplit(url).netloc
+            self._samples.setdefault(host, deque(maxlen=self.window)).append(elapsed_ms)
+
+    def stats(self):
+        with self._lock:
+            hosts = {host: list(samples) for host, samples in self._samples.items()}
+        return {
+            host: {
+                "loads": len(samples),
+                "last_ms": round(samples[-1]),
+                "max_ms": round(max(samples)),
+                "timeout_ms": self.timeout_ms("//" + host),
+            }
+            for host, samples in hosts.items()
+        }
+
+PAGE_TIMEOUTS = AdaptiveTimeout()
+
+# Pooled keep-alive HTTP client for the first fetch tier.
+# fetch() returns the page HTML, or None when the server refused or errored,
+# in which case the caller escalates to Chromium.
+class HttpFetcher:
+    def __init__(self, pool_size=HTTP_POOL_SIZE, timeout=HTTP_TIMEOUT_S):
+        if requests is None:
+            raise RuntimeError("The HTTP tier needs requests (pip install requests)")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url):
+        with METRICS.stage("http_fetch", url=url) as stage:
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.RequestException as exc:
+                logging.info("HTTP tier failed for %s: %s", url, exc)
+                stage["status"] = "error"
+                return None
+            stage["status"] = response.status_code
+            stage["bytes"] = len(response.content)
+        if response.status_code != 200:
+            return None
+        # Without a charset in Content-Type requests assumes ISO-8859-1; decode
+        # the way the browser does instead, from <meta charset> or the bytes
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            declared = _META_CHARSET.search(response.content[:4096])
+            response.encoding = declared.group(1).decode("ascii") if declared else response.apparent_encoding
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+# Blocks unneeded requests on a browser context and counts what it saved.
+# Loaded bytes come from Content-Length; avoided bytes are an estimate from
+# TYPICAL_RESOURCE_BYTES. A filter with no rules only measures.
+class ResourceFilter:
+    def __init__(self, blocked_types=BLOCKED_RESOURCE_TYPES, blocked_patterns=BLOCKED_URL_PATTERNS,
+                 allowed_patterns=ALLOWED_URL_PATTERNS):
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_patterns = re.compile("|".join(blocked_patterns)) if blocked_patterns else None
+        self.allowed_patterns = re.compile("|".join(allowed_patterns)) if allowed_patterns else None
+        self._lock = threading.Lock()
+        self._allowed = Counter()
+        self._blocked = Counter()
+        self._bytes_loaded = 0
+        self._bytes_avoided = 0
 
-        logging.info("Loading page...")
+    # Why a request should be blocked, or None to let it through
+    def block_reason(self, url, resource_type):
+        if self.allowed_patterns and self.allowed_patterns.search(url):
+            return None
+        if self.blocked_patterns and self.blocked_patterns.search(url):
+            return "pattern"
+        if resource_type == "document":
+            return None
+        if resource_type in self.blocked_types:
+            return "type"
+        return None
+
+    def _decide(self, request):
+        resource_type = request.resource_type
+        blocked = self.block_reason(request.url, resource_type) is not None
+        with self._lock:
+            if blocked:
+                self._blocked[resource_type] += 1
+                self._bytes_avoided += TYPICAL_RESOURCE_BYTES.get(resource_type, TYPICAL_RESOURCE_BYTES["other"])
+            else:
+                self._allowed[resource_type] += 1
+        return blocked
+
+    def _route(self, route):
+        if self._decide(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_async(self, route):
+        if self._decide(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_response(self, response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            with self._lock:
+                self._bytes_loaded += int(length)
+
+    def install(self, context):
+        context.route("**/*", self._route)
+        context.on("response", self._on_response)
+
+    async def install_async(self, context):
+        await context.route("**/*", self._route_async)
+        context.on("response", self._on_response)
+
+    def report(self):
+        with self._lock:
+            return {
+                "requests_allowed": sum(self._allowed.values()),
+                "requests_blocked": sum(self._blocked.values()),
+                "blocked_by_type": dict(self._blocked),
+                "bytes_loaded": self._bytes_loaded,
+                "bytes_avoided_estimate": self._bytes_avoided,
+            }
+
+def _check_ready_strategy(strategy):
+    if strategy not in READY_STRATEGIES:
+        raise ValueError(f"Unknown ready strategy {strategy!r}, expected one of {READY_STRATEGIES}")
+
+# Block until the page's tables are usable, per the chosen strategy.
+# Waits go through page.wait_for_timeout, not time.sleep: the sync API only
+# runs route handlers (ResourceFilter) while inside a Playwright call, so a
+# plain sleep would stall every intercepted request, the table XHRs included.
+def wait_until_ready(page, strategy, timeout_ms):
+    if strategy == "sleep":
+        page.wait_for_timeout(LEGACY_SLEEP_S * 1000)
+        return
+    if strategy == "networkidle":
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return
+
+    deadline = time.monotonic() + timeout_ms / 1000
+    page.wait_for_selector(READY_SELECTOR, state="attached", timeout=timeout_ms)
+    if strategy == "selector":
+        return
+
+    last_count, stable = -1, 0
+    while stable < STABLE_ROUNDS and time.monotonic() < deadline:
+        count = page.evaluate(ROW_COUNT_JS)
+        stable = stable + 1 if count == last_count else 0
+        last_count = count
+        if stable < STABLE_ROUNDS:
+            page.wait_for_timeout(STABLE_POLL_S * 1000)
+
+# Navigate an open page and return its rendered HTML
+def load_page_html(page, url, ready=DEFAULT_READY_STRATEGY, timeouts=PAGE_TIMEOUTS):
+    _check_ready_strategy(ready)
+    timeout_ms = timeouts.timeout_ms(url)
+    logging.info("Loading page %s (timeout %d ms, ready=%s)", url, timeout_ms, ready)
+    start = time.monotonic()
+    with METRICS.stage("goto", url=url):
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=DEFAULT_TIMEOUT_MS)
+            page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
         except PWTimeoutError:
             logging.warning("Timeout during page load, proceeding anyway.")
 
-        time.sleep(5)  # extra wait for JS tables
+    remaining_ms = max(1000, timeout_ms - (time.monotonic() - start) * 1000)
+    with METRICS.stage("ready", url=url, strategy=ready):
+        try:
+            wait_until_ready(page, ready, remaining_ms)
+        except PWTimeoutError:
+            logging.warning("Tables not ready on %s, proceeding anyway.", url)
+
+    elapsed_ms = (time.monotonic() - start) * 1000
+    timeouts.record(url, elapsed_ms)
+    logging.info("Page %s ready in %.0f ms", url, elapsed_ms)
+    with METRICS.stage("content", url=url) as stage:
         html = page.content()
-        with open(DEBUG_HTML, "w", encoding="utf-8") as f:
-            f.write(html)
-        logging.info("Saved debug HTML to %s", DEBUG_HTML)
-        browser.close()
+        stage["bytes"] = len(html)
+    return html
 
-        soup = BeautifulSoup(html, "html.parser")
-        tables = soup.find_all("table")
-        all_dfs = []
+# Async variant of wait_until_ready
+async def wait_until_ready_async(page, strategy, timeout_ms):
+    if strategy == "sleep":
+        await asyncio.sleep(LEGACY_SLEEP_S)
+        return
+    if strategy == "networkidle":
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return
 
-        for idx, table in enumerate(tables):
-            df_table = parse_and_rank_table(table, idx)
-            if not df_table.empty:
-                all_dfs.append(df_table)
+    deadline = time.monotonic() + timeout_ms / 1000
+    await page.wait_for_selector(READY_SELECTOR, state="attached", timeout=timeout_ms)
+    if strategy == "selector":
+        return
+
+    last_count, stable = -1, 0
+    while stable < STABLE_ROUNDS and time.monotonic() < deadline:
+        count = await page.evaluate(ROW_COUNT_JS)
+        stable = stable + 1 if count == last_count else 0
+        last_count = count
+        if stable < STABLE_ROUNDS:
+            await asyncio.sleep(STABLE_POLL_S)
+
+# Async variant of load_page_html
+async def load_page_html_async(page, url, ready=DEFAULT_READY_STRATEGY, timeouts=PAGE_TIMEOUTS):
+    _check_ready_strategy(ready)
+    timeout_ms = timeouts.timeout_ms(url)
+    logging.info("Loading page %s (timeout %d ms, ready=%s)", url, timeout_ms, ready)
+    start = time.monotonic()
+    with METRICS.stage("goto", url=url):
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+        except PWTimeoutError:
+            logging.warning("Timeout during page load, proceeding anyway.")
+
+    remaining_ms = max(1000, timeout_ms - (time.monotonic() - start) * 1000)
+    with METRICS.stage("ready", url=url, strategy=ready):
+        try:
+            await wait_until_ready_async(page, ready, remaining_ms)
+        except PWTimeoutError:
+            logging.warning("Tables not ready on %s, proceeding anyway.", url)
+
+    elapsed_ms = (time.monotonic() - start) * 1000
+    timeouts.record(url, elapsed_ms)
+    logging.info("Page %s ready in %.0f ms", url, elapsed_ms)
+    with METRICS.stage("content", url=url) as stage:
+        html = await page.content()
+        stage["bytes"] = len(html)
+    return html
+
+# Lazily started browser context shared by the pages of one async scrape.
+# URLs served by the HTTP tier never start Chromium at all.
+# A failed launch tears the driver down again and is remembered for
+# LAUNCH_RETRY_S, so pages waiting on the lock fail fast instead of each
+# starting (and leaking) another driver; long-running callers retry later.
+class LazyBrowser:
+    def __init__(self, headless, resource_filter):
+        self.headless = headless
+        self.resource_filter = resource_filter
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._launch_error = None
+        self._failed_at = 0.0
+
+    async def context(self):
+        async with self._lock:
+            if self._context is None:
+                if self._launch_error is not None and time.monotonic() - self._failed_at < LAUNCH_RETRY_S:
+                    raise RuntimeError("Chromium launch failed earlier") from self._launch_error
+                logging.info("Starting Chromium")
+                try:
+                    with METRICS.stage("browser_launch"):
+                        self._playwright = await async_playwright().start()
+                        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                    self._context = await self._browser.new_context(
+                        user_agent=DEFAULT_USER_AGENT, viewport=DEFAULT_VIEWPORT)
+                    if self.resource_filter is not None:
+                        await self.resource_filter.install_async(self._context)
+                except Exception as exc:
+                    logging.error("Could not start Chromium: %s", exc)
+                    self._launch_error, self._failed_at = exc, time.monotonic()
+                    await self.close()
+                    raise
+                self._launch_error = None
+            return self._context
+
+    # A page that cannot be opened means Chromium crashed or went away under
+    # us: drop it so the next page relaunches instead of failing forever
+    async def new_page(self):
+        context = await self.context()
+        try:
+            return await context.new_page()
+        except Exception:
+            async with self._lock:
+                if self._context is context:
+                    logging.warning("Chromium stopped responding, relaunching on the next page")
+                    try:
+                        await self.close()
+                    except Exception as exc:
+                        logging.warning("Could not close the dead browser: %s", exc)
+            raise
+
+    async def close(self):
+        browser, playwright = self._browser, self._playwright
+        self._playwright = self._browser = self._context = None
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
+
+# Fetch one URL, HTTP tier first, bounded by the shared semaphore
+async def fetch_page_async(browser, semaphore, url, url_timeout, ready, cache, http):
+    start = time.perf_counter()
+    result = await _fetch_page_tiers_async(browser, semaphore, url, url_timeout, ready, cache, http)
+    _observe_page(result.url, result.tier, result.html, result.df, time.perf_counter() - start)
+    return result
+
+# One record per URL: which tier served it, how much HTML, how many tables/rows
+def _observe_page(url, tier, html, df, seconds):
+    tables = int(df["table_index"].nunique()) if not df.empty else 0
+    METRICS.observe("page", seconds, url=url, tier=tier, bytes=len(html or ""), tables=tables, rows=len(df))
+
+async def _fetch_page_tiers_async(browser, semaphore, url, url_timeout, ready, cache, http):
+    async with semaphore:
+        if http is not None:
+            html = await asyncio.to_thread(http.fetch, url)
+            if html:
+                df, cached = rank_html(html, url, cache)
+                if not df.empty:
+                    logging.info("%s served by http tier", url)
+                    return PageResult(url, html, df, cached, "http")
+                logging.info("No tables in plain HTTP response for %s, escalating to browser", url)
 
-        if not all_dfs:
-            logging.error("No tables parsed successfully.")
-            return pd.DataFrame()
-        combined_df = pd.concat(all_dfs, ignore_index=True)
-        return combined_df
+        html = page = None
+        try:
+            page = await browser.new_page()
+            html = await asyncio.wait_for(load_page_html_async(page, url, ready), url_timeout)
+        except asyncio.TimeoutError:
+            logging.warning("Gave up on %s after %ss", url, url_timeout)
+        except Exception:
+            logging.exception("Failed to scrape %s", url)
+        finally:
+            if page is not None:
+                await page.close()
+
+    df, cached = rank_html(html, url, cache) if html else (pd.DataFrame(), False)
+    logging.info("%s served by browser tier", url)
+    return PageResult(url, html, df, cached, "browser")
+
+# Scrape many URLs concurrently, yielding each PageResult as soon as its page finishes
+async def scrape_stream_async(targets, headless=True, concurrency=DEFAULT_CONCURRENCY,
+                              url_timeout=DEFAULT_URL_TIMEOUT_S, ready=DEFAULT_READY_STRATEGY,
+                              cache=None, resource_filter=None, http=None, archive=None):
+    urls = normalize_targets(targets)
+    if not urls:
+        return
+
+    browser = LazyBrowser(headless, resource_filter)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = [
+        asyncio.create_task(fetch_page_async(browser, semaphore, url, url_timeout, ready, cache, http))
+        for url in urls
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if archive is not None and result.html:
+                archive.submit(result.url, result.html)
+            if result.df.empty:
+                logging.warning("No tables parsed from %s", result.url)
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await browser.close()
+
+# Async scraping of a single URL
+async def scrape_multiple_tables_async(url, headless=True, url_timeout=DEFAULT_URL_TIMEOUT_S,
+                                       ready=DEFAULT_READY_STRATEGY, cache=None, resource_filter=None,
+                                       http=None, archive=None):
+    combined_df = pd.DataFrame()
+    async for result in scrape_stream_async([url], headless=headless, concurrency=1,
+                                            url_timeout=url_timeout, ready=ready, cache=cache,
+                                            resource_filter=resource_filter, http=http,
+                                            archive=archive):
+        if result.cached:
+            combined_df = result.df
+            continue
+        if result.html and archive is None:
+            with open(DEBUG_HTML, "w", encoding="utf-8") as f:
+                f.write(result.html)
+            logging.info("Saved debug HTML to %s", DEBUG_HTML)
+        combined_df = result.df
+
+    if combined_df.empty:
+        logging.error("No tables parsed successfully.")
+    return combined_df
+
+# Async batch scraping, combined in input order with a source_url column
+async def scrape_many_async(targets, headless=True, concurrency=DEFAULT_CONCURRENCY,
+                            url_timeout=DEFAULT_URL_TIMEOUT_S, ready=DEFAULT_READY_STRATEGY,
+                            cache=None, resource_filter=None, http=None, archive=None):
+    urls = normalize_targets(targets)
+    by_url = {}
+    async for result in scrape_stream_async(urls, headless=headless, concurrency=concurrency,
+                                            url_timeout=url_timeout, ready=ready, cache=cache,
+                                            resource_filter=resource_filter, http=http,
+                                            archive=archive):
+        if not result.df.empty:
+            by_url[result.url] = result.df.assign(source_url=result.url)
+
+    all_dfs = [by_url[url] for url in dict.fromkeys(urls) if url in by_url]
+    if not all_dfs:
+        logging.error("No tables parsed successfully.")
+        return pd.DataFrame()
+    combined_df = concat_ranked(all_dfs)
+    combined_df = combined_df[["source_url"] + [c for c in combined_df.columns if c != "source_url"]]
+    return combined_df
+
+# Main scraping
+def scrape_multiple_tables(url, headless=True, ready=DEFAULT_READY_STRATEGY, cache=None,
+                           resource_filter=None, http=None, archive=None):
+    return asyncio.run(scrape_multiple_tables_async(url, headless=headless, ready=ready, cache=cache,
+                                                    resource_filter=resource_filter, http=http,
+                                                    archive=archive))
+
+# Pool worker: one long-lived browser/context/page reused for many URLs.
+# Sync Playwright objects are bound to the thread that created them, so
+# each worker owns its own browser instead of sharing pages across threads.
+# The browser is only started once a URL has to escalate past the HTTP tier.
+def _pool_worker(jobs, results, headless, ready, cache, resource_filter, http, archive):
+    playwright = browser = context = page = None
+    launch_failed = False
+    try:
+        while True:
+            try:
+                order, url = jobs.get_nowait()
+            except queue.Empty:
+                break
+
+            start = time.perf_counter()
+            df, cached, tier = pd.DataFrame(), False, "http"
+            html = http.fetch(url) if http is not None else None
+            if html:
+                df, cached = rank_html(html, url, cache)
+            if df.empty:
+                tier = "browser"
+                if page is None and not launch_failed:
+                    try:
+                        with METRICS.stage("browser_launch"):
+                            playwright = sync_playwright().start()
+                            browser = playwright.chromium.launch(headless=headless)
+                        context = browser.new_context(user_agent=DEFAULT_USER_AGENT, viewport=DEFAULT_VIEWPORT)
+                        if resource_filter is not None:
+                            resource_filter.install(context)
+                        page = context.new_page()
+                    except Exception as exc:
+                        # Keep draining the queue: HTTP-tier URLs still work, the rest come back empty
+                        logging.error("Could not start Chromium: %s", exc)
+                        launch_failed = True
+                        _stop_sync_browser(playwright, browser)
+                        playwright = browser = context = page = None
+                if page is None:
+                    df, cached = pd.DataFrame(), False
+                else:
+                    try:
+                        html = load_page_html(page, url, ready)
+                        df, cached = rank_html(html, url, cache)
+                    except Exception:
+                        logging.exception("Failed to scrape %s", url)
+                        # A crashed page cannot be reused, start a fresh one
+                        page.close()
+                        page = context.new_page()
+                        df, cached = pd.DataFrame(), False
+            logging.info("%s served by %s tier", url, tier)
+            _observe_page(url, tier, html, df, time.perf_counter() - start)
+            if archive is not None and html:
+                archive.submit(url, html)
+            if df.empty:
+                logging.warning("No tables parsed from %s", url)
+            results[order] = (df, cached)
+    finally:
+        _stop_sync_browser(playwright, browser)
+
+def _stop_sync_browser(playwright, browser):
+    try:
+        if browser is not None:
+            browser.close()
+    finally:
+        if playwright is not None:
+            playwright.stop()
+
+# Batch scraping through a bounded pool of warm browsers
+def scrape_many(targets, headless=True, pool_size=DEFAULT_POOL_SIZE, ready=DEFAULT_READY_STRATEGY,
+                cache=None, resource_filter=None, http=None, archive=None):
+    urls = normalize_targets(targets)
+    if not urls:
+        return pd.DataFrame()
+
+    jobs = queue.Queue()
+    for order, url in enumerate(urls):
+        jobs.put((order, url))
+    results = [(pd.DataFrame(), False)] * len(urls)
+
+    workers = [
+        threading.Thread(target=_pool_worker, daemon=True,
+                         args=(jobs, results, headless, ready, cache, resource_filter, http, archive))
+        for _ in range(max(1, min(pool_size, len(urls))))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    all_dfs = []
+    for url, (df, _) in zip(urls, results):
+        if df.empty:
+            continue
+        df.insert(0, "source_url", url)
+        all_dfs.append(df)
+
+    if not all_dfs:
+        logging.error("No tables parsed successfully.")
+        return pd.DataFrame()
+    combined_df = concat_ranked(all_dfs)
+    return combined_df
+
+# Command line options
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape and rank CricClubs points tables.")
+    parser.add_argument("urls", nargs="*", help="points-table URLs (defaults to URL)")
+    parser.add_argument("--league", action="append", default=[], metavar="LEAGUE:CLUB_ID",
+                        help="league/clubId pair, may be repeated")
+    parser.add_argument("--urls-file", help="file with one URL per line")
+    parser.add_argument("--mode", choices=("async", "pool"), default="async",
+                        help="batch mode: asyncio pages or a pool of browser threads")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--url-timeout", type=float, default=DEFAULT_URL_TIMEOUT_S,
+                        help="per-URL timeout in seconds (async mode)")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE)
+    parser.add_argument("--ready", choices=READY_STRATEGIES, default=DEFAULT_READY_STRATEGY,
+                        help="how to decide a page's tables are rendered")
+    parser.add_argument("--headless", action="store_true", help="run Chromium headless")
+    parser.add_argument("--snapshots", metavar="PATH",
+                        help="parse saved HTML (file, directory or glob) instead of scraping")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="with --snapshots, parse in this many processes (0 = serial)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="jobs handed to a worker process at a time")
+    parser.add_argument("--parallel-unit", choices=PARALLEL_UNITS, default="snapshot",
+                        help="fan out whole snapshots or individual tables")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR,
+                        help="compressed snapshot archive that replaces the page_debug.html overwrite")
+    parser.add_argument("--no-archive", action="store_true",
+                        help=f"don't archive pages, overwrite {DEBUG_HTML} instead")
+    parser.add_argument("--from-archive", action="store_true",
+                        help="parse snapshots of the given targets (all when none) from --archive-dir instead of scraping")
+    parser.add_argument("--since", help="with --from-archive, only snapshots fetched at or after this ISO time")
+    parser.add_argument("--latest", action="store_true", help="with --from-archive, newest snapshot per URL")
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help="write stage metrics as JSON (.json) or Prometheus text (anything else)")
+    parser.add_argument("--output", default="all_tables_ranked.csv")
+    parser.add_argument("--sink", action="append", default=[], metavar="KIND:PATH",
+                        help="output sink (csv:, parquet: or arrow:), may be repeated; defaults to csv:--output")
+    parser.add_argument("--append", action="store_true", help="append to sinks instead of replacing")
+    parser.add_argument("--standings-db", nargs="?", const=STANDINGS_DB,
+                        help=f"record standings in SQLite and report only changes (default {STANDINGS_DB})")
+    parser.add_argument("--changes-output", metavar="PATH",
+                        help="write the change set as .json or .csv")
+    parser.add_argument("--changes-only", action="store_true",
+                        help="with --standings-db, skip the full CSV")
+    parser.add_argument("--browser-only", action="store_true",
+                        help="skip the plain HTTP tier and always render with Chromium")
+    parser.add_argument("--no-filter", action="store_true",
+                        help="load every resource (still counts requests and bytes)")
+    parser.add_argument("--block-types", default=",".join(BLOCKED_RESOURCE_TYPES),
+                        help="comma-separated Playwright resource types to block")
+    parser.add_argument("--block-pattern", action="append", default=[], metavar="REGEX",
+                        help="extra URL pattern to block, may be repeated")
+    parser.add_argument("--allow-pattern", action="append", default=[], metavar="REGEX",
+                        help="extra URL pattern that is never blocked, may be repeated")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always re-parse and rewrite, ignoring cached rankings")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--cache-max-entries", type=int, default=CACHE_MAX_ENTRIES)
+    parser.add_argument("--cache-max-age", type=float, default=CACHE_MAX_AGE_S, help="seconds")
+    return parser.parse_args(argv)
+
+# Collect scrape targets from the command line
+def targets_from_args(args):
+    targets = list(args.urls)
+    for pair in args.league:
+        league, club_id = pair.split(":", 1)
+        targets.append((league, club_id))
+    if args.urls_file:
+        with open(args.urls_file, encoding="utf-8") as f:
+            targets.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    return targets
+
+# League id for every row, from source_url or the single scraped URL
+def league_column(df_all, default_url):
+    if "source_url" in df_all:
+        return df_all["source_url"].map(league_key).astype("category")
+    return pd.Series(league_key(default_url), index=df_all.index, dtype="category")
+
+# Upsert the scraped standings and return the combined change set
+def record_standings(df_all, db_path, default_url):
+    all_changes = []
+    with StandingsStore(db_path) as store:
+        for league, df_league in df_all.groupby(league_column(df_all, default_url), sort=False, observed=True):
+            all_changes.append(store.apply(df_league, league))
+    return pd.concat(all_changes, ignore_index=True)
+
+# Write the results to every sink; columnar sinks also get league and date columns
+def write_sinks(df_all, sinks, default_url, manifest=None, date=None):
+    date = date or pd.Timestamp.now(tz="UTC").date().isoformat()
+    framed = None
+    for sink in sinks:
+        if isinstance(sink, CsvSink):
+            with METRICS.stage("write", sink="csv", rows=len(df_all)):
+                sink.write(df_all, manifest)
+            continue
+        if framed is None:
+            framed = df_all.copy()
+            if "source_path" not in framed:
+                framed["league"] = league_column(framed, default_url)
+            framed["date"] = date
+        with METRICS.stage("write", sink=type(sink).__name__, rows=len(framed)):
+            sink.write(framed, sink_manifest(sink, manifest, date))
+
+# Columnar sinks get a date column (and date= partitions) too, so what they
+# hold depends on the day as well as on the tables
+def sink_manifest(sink, manifest, date):
+    if manifest is None or isinstance(sink, CsvSink):
+        return manifest
+    return {**manifest, "date": date}
+
+# {source: content digest} of a combined result, recorded next to each sink
+# so an unchanged rerun can tell the output already holds exactly this result
+def result_manifest(df_all, default_url):
+    key = next((c for c in ("source_url", "source_path") if c in df_all), None)
+    groups = df_all.groupby(key, sort=False, observed=True) if key else [(default_url, df_all)]
+    manifest = {}
+    for source, group in groups:
+        hashes = pd.util.hash_pandas_object(group.reset_index(drop=True), index=False)
+        manifest[str(source)] = hashlib.sha256(hashes.to_numpy().tobytes()).hexdigest()
+    return manifest
 
 # Run
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    df_all = scrape_multiple_tables(URL, headless=False)  # set headless=True if Cloudflare solved
-    if not df_all.empty:
-        print(df_all.to_string(index=False))
-        df_all.to_csv("all_tables_ranked.csv", index=False)
-        logging.info("Saved CSV all_tables_ranked.csv")
+    args = parse_args()
+    run_start = time.perf_counter()
+    targets = targets_from_args(args)
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_max_entries, args.cache_max_age)
+    archive = None if args.no_archive else SnapshotArchive(args.archive_dir)
+    http = None if args.browser_only or requests is None else HttpFetcher()
+    if args.no_filter:
+        resource_filter = ResourceFilter(blocked_types=(), blocked_patterns=())
     else:
+        resource_filter = ResourceFilter(
+            blocked_types=[t for t in args.block_types.split(",") if t],
+            blocked_patterns=BLOCKED_URL_PATTERNS + tuple(args.block_pattern),
+            allowed_patterns=ALLOWED_URL_PATTERNS + tuple(args.allow_pattern),
+        )
+    scrape_start = time.perf_counter()
+    if args.from_archive:
+        df_all = parse_archive(archive or SnapshotArchive(args.archive_dir), url=normalize_targets(targets) or None,
+                               since=args.since, latest_only=args.latest)
+    elif args.snapshots and args.workers:
+        df_all = parse_snapshots_parallel(args.snapshots, workers=args.workers,
+                                          chunksize=args.chunksize, unit=args.parallel_unit)
+    elif args.snapshots:
+        df_all = parse_snapshots(args.snapshots)
+    elif len(targets) > 1 and args.mode == "pool":
+        df_all = scrape_many(targets, headless=args.headless, pool_size=args.pool_size,
+                             ready=args.ready, cache=cache, resource_filter=resource_filter,
+                             http=http, archive=archive)
+    elif len(targets) > 1:
+        df_all = asyncio.run(scrape_many_async(targets, headless=args.headless,
+                                               concurrency=args.concurrency,
+                                               url_timeout=args.url_timeout,
+                                               ready=args.ready, cache=cache,
+                                               resource_filter=resource_filter, http=http,
+                                               archive=archive))
+    else:
+        url = normalize_targets(targets)[0] if targets else URL
+        df_all = scrape_multiple_tables(url, headless=args.headless, ready=args.ready, cache=cache,
+                                        resource_filter=resource_filter, http=http,
+                                        archive=archive)  # pass --headless if Cloudflare solved
+    METRICS.observe("scrape", time.perf_counter() - scrape_start, rows=len(df_all))
+    for host, stats in PAGE_TIMEOUTS.stats().items():
+        logging.info("Load times for %s: %s", host, stats)
+    if not (args.snapshots or args.from_archive):
+        logging.info("Network: %s", resource_filter.report())
+    if archive is not None:
+        archive.close()
+        logging.info("Snapshot archive %s: %s", args.archive_dir, archive.stats())
+    changes = None
+    default_url = normalize_targets(targets)[0] if targets else URL
+    if args.standings_db and not df_all.empty and not (args.snapshots or args.from_archive):
+        with METRICS.stage("standings"):
+            changes = record_standings(df_all, args.standings_db, default_url)
+        moves = rank_moves(changes)
+        if not moves.empty:
+            print(moves.to_string(index=False))
+        logging.info("%d changed rows, %d rank moves", len(changes), len(moves))
+        if args.changes_output and args.changes_output.endswith(".json"):
+            with open(args.changes_output, "w", encoding="utf-8") as f:
+                f.write(changes_to_json(changes, indent=2))
+        elif args.changes_output:
+            changes.to_csv(args.changes_output, index=False)
+
+    if df_all.empty:
         logging.error("No ranking data extracted.")
+    elif changes is None or not args.changes_only:
+        print(df_all.to_string(index=False))
+        sinks = [make_sink(spec, append=args.append) for spec in args.sink] or [
+            CsvSink(args.output, append=args.append)
+        ]
+        manifest = result_manifest(df_all, default_url)
+        today = pd.Timestamp.now(tz="UTC").date().isoformat()
+        stale = [sink for sink in sinks if not sink.holds(sink_manifest(sink, manifest, today))]
+        if stale:
+            write_sinks(df_all, stale, default_url, manifest, today)
+        else:
+            logging.info("All tables unchanged, leaving outputs as they are")
+
+    METRICS.observe("run", time.perf_counter() - run_start, rows=len(df_all))
+    if args.metrics_file:
+        METRICS.write(args.metrics_file)
+        logging.info("Saved metrics to %s", args.metrics_file)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# Long-running scheduler for ranking_scrapper.
+#
+# Keeps pandas/bs4/Playwright imported and one browser warm, refreshes each
+# league on its own interval with jitter, shares a global requests-per-minute
+# budget, backs off exponentially on timeouts and Cloudflare challenges, and
+# never runs the same league twice at once.
+#
+#   python scrape_daemon.py --leagues leagues.json --rpm 12 --standings-db
+#
+# leagues.json: [{"url": "...", "interval": 900}, {"league": 20, "club_id": 24301}]
+import time
+import json
+import heapq
+import random
+import signal
+import asyncio
+import logging
+import argparse
+import pandas as pd
+import ranking_scrapper as rs
+from scrape_metrics import METRICS
+from output_sinks import make_sink
+from standings_store import StandingsStore, STANDINGS_DB, rank_moves
+
+DEFAULT_INTERVAL_S = 15 * 60
+DEFAULT_RPM = 12
+DEFAULT_JITTER = 0.15
+BASE_BACKOFF_S = 60
+MAX_BACKOFF_S = 6 * 3600
+CHALLENGE_MARKERS = ("just a moment...", "cf-challenge", "challenge-platform", "cf_chl_opt")
+
+# True when Cloudflare served its interstitial instead of the page
+def is_challenge_page(html):
+    head = (html or "")[:20000].lower()
+    return any(marker in head for marker in CHALLENGE_MARKERS)
+
+# One scheduled league and its backoff state
+class League:
+    def __init__(self, url, interval=DEFAULT_INTERVAL_S):
+        self.url = url
+        self.key = rs.league_key(url)
+        self.interval = interval
+        self.failures = 0
+        self.unpublished = False
+
+    @classmethod
+    def from_config(cls, entry):
+        if isinstance(entry, str):
+            return cls(entry)
+        url = entry.get("url") or rs.league_url(entry["league"], entry["club_id"],
+                                                entry.get("site", "FortyPlusLeague"))
+        return cls(url, entry.get("interval", DEFAULT_INTERVAL_S))
+
+def load_leagues(path):
+    with open(path, encoding="utf-8") as f:
+        return [League.from_config(entry) for entry in json.load(f)]
+
+# Token bucket shared by every league: at most rpm page loads per minute
+class RateLimiter:
+    def __init__(self, rpm):
+        self.capacity = max(1, rpm)
+        self.rate = rpm / 60.0
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class ScrapeDaemon:
+    def __init__(self, leagues, rpm=DEFAULT_RPM, jitter=DEFAULT_JITTER, concurrency=rs.DEFAULT_CONCURRENCY,
+                 headless=True, ready=rs.DEFAULT_READY_STRATEGY, url_timeout=rs.DEFAULT_URL_TIMEOUT_S,
+                 max_backoff=MAX_BACKOFF_S, cache=None, http=None, resource_filter=None, archive=None,
+                 standings_db=None, sinks=(), metrics_file=None):
+        self.leagues = {league.key: league for league in leagues}
+        self.limiter = RateLimiter(rpm)
+        self.jitter = jitter
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        self.browser = rs.LazyBrowser(headless, resource_filter)
+        self.ready = ready
+        self.url_timeout = url_timeout
+        self.max_backoff = max_backoff
+        self.cache = cache
+        self.http = http
+        self.archive = archive
+        self.standings_db = standings_db
+        self.sinks = list(sinks)
+        self.metrics_file = metrics_file
+        self.in_flight = {}
+        self._queue = []
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+
+    def _jittered(self, seconds):
+        return seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _schedule(self, league, delay):
+        heapq.heappush(self._queue, (time.monotonic() + max(0.0, delay), league.key))
+        self._wakeup.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
+
+    async def run(self):
+        # Spread the first round over one jitter window instead of a burst
+        for league in self.leagues.values():
+            self._schedule(league, random.uniform(0, self.jitter * league.interval))
+        try:
+            while not self._stopping.is_set():
+                if not self._queue:
+                    await self._wait(None)
+                    continue
+                due, key = self._queue[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await self._wait(delay)
+                    continue
+                heapq.heappop(self._queue)
+                if key in self.in_flight:
+                    # Single-flight: the running scrape reschedules this league when it ends
+                    continue
+                task = asyncio.create_task(self._scrape(self.leagues[key]))
+                self.in_flight[key] = task
+                task.add_done_callback(lambda _, key=key: self.in_flight.pop(key, None))
+        finally:
+            for task in list(self.in_flight.values()):
+                task.cancel()
+            await asyncio.gather(*self.in_flight.values(), return_exceptions=True)
+            await self.browser.close()
+            if self.archive is not None:
+                self.archive.close()
+
+    async def _wait(self, timeout):
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    # Always reschedules the league: a failed publish backs off like a failed scrape
+    async def _scrape(self, league):
+        delay = None
+        try:
+            await self.limiter.acquire()
+            start = time.perf_counter()
+            try:
+                result = await rs.fetch_page_async(self.browser, self.semaphore, league.url, self.url_timeout,
+                                                   self.ready, self.cache, self.http)
+            except Exception:
+                logging.exception("Scrape of %s crashed", league.key)
+                result = None
+
+            if result is None or result.html is None:
+                delay = self._back_off(league, "timeout or error")
+            elif is_challenge_page(result.html):
+                delay = self._back_off(league, "Cloudflare challenge")
+            elif result.df.empty:
+                delay = self._back_off(league, "no tables")
+            else:
+                if self.archive is not None:
+                    self.archive.submit(league.url, result.html)
+                # The ranking is already cached, so a change whose publish failed
+                # comes back as cached=True and has to be published anyway
+                if not result.cached or league.unpublished:
+                    league.unpublished = True
+                    self._publish(league, result.df)
+                    league.unpublished = False
+                league.failures = 0
+            METRICS.observe("league", time.perf_counter() - start, url=league.url,
+                            status="ok" if league.failures == 0 else "failed")
+            if self.metrics_file:
+                METRICS.write(self.metrics_file)
+        except Exception:
+            logging.exception("Publishing %s failed", league.key)
+            delay = self._back_off(league, "publish error")
+        finally:
+            self._schedule(league, self._jittered(league.interval) if delay is None else delay)
+
+    def _back_off(self, league, reason):
+        league.failures += 1
+        delay = min(self.max_backoff, BASE_BACKOFF_S * 2 ** (league.failures - 1))
+        logging.warning("%s failed (%s), attempt %d, retrying in %.0fs", league.key, reason,
+                        league.failures, delay)
+        return self._jittered(delay)
+
+    def _publish(self, league, df):
+        if self.standings_db:
+            with StandingsStore(self.standings_db) as store:
+                changes = store.apply(df, league.key)
+            moves = rank_moves(changes)
+            if not moves.empty:
+                logging.info("Rank moves in %s:\n%s", league.key, moves.to_string(index=False))
+        if self.sinks:
+            framed = df.assign(source_url=league.url, league=league.key,
+                               date=pd.Timestamp.now(tz="UTC").date().isoformat())
+            for sink in self.sinks:
+                with METRICS.stage("write", sink=type(sink).__name__, rows=len(framed)):
+                    sink.write(framed)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Keep CricClubs standings fresh on a schedule.")
+    parser.add_argument("--leagues", required=True, help="JSON list of leagues with optional intervals")
+    parser.add_argument("--rpm", type=float, default=DEFAULT_RPM, help="global page loads per minute")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_JITTER,
+                        help="fractional jitter applied to every interval and backoff")
+    parser.add_argument("--max-backoff", type=float, default=MAX_BACKOFF_S, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=rs.DEFAULT_CONCURRENCY)
+    parser.add_argument("--headless", action="store_true", help="run Chromium headless")
+    parser.add_argument("--ready", choices=rs.READY_STRATEGIES, default=rs.DEFAULT_READY_STRATEGY)
+    parser.add_argument("--url-timeout", type=float, default=rs.DEFAULT_URL_TIMEOUT_S)
+    parser.add_argument("--browser-only", action="store_true", help="skip the plain HTTP tier")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--no-archive", action="store_true")
+    parser.add_argument("--archive-dir", default=rs.ARCHIVE_DIR)
+    parser.add_argument("--standings-db", nargs="?", const=STANDINGS_DB)
+    parser.add_argument("--sink", action="append", default=[], metavar="KIND:PATH",
+                        help="append every changed scrape to this sink, may be repeated")
+    parser.add_argument("--metrics-file", metavar="PATH")
+    return parser.parse_args(argv)
+
+async def main(args):
+    daemon = ScrapeDaemon(
+        load_leagues(args.leagues),
+        rpm=args.rpm,
+        jitter=args.jitter,
+        concurrency=args.concurrency,
+        headless=args.headless,
+        ready=args.ready,
+        url_timeout=args.url_timeout,
+        max_backoff=args.max_backoff,
+        cache=None if args.no_cache else rs.ResultCache(),
+        http=None if args.browser_only or rs.requests is None else rs.HttpFetcher(),
+        resource_filter=rs.ResourceFilter(),
+        archive=None if args.no_archive else rs.SnapshotArchive(args.archive_dir),
+        standings_db=args.standings_db,
+        sinks=[make_sink(spec, append=True) for spec in args.sink],
+        metrics_file=args.metrics_file,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, daemon.stop)
+    logging.info("Scheduling %d leagues at %.1f requests/min", len(daemon.leagues), args.rpm)
+    await daemon.run()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import json
+import time
+import uuid
+import logging
+import threading
+from contextlib import contextmanager
+
+# Fields that become metric labels; everything else (url, ...) only goes to the log line
+LABEL_FIELDS = ("tier", "strategy", "sink", "hit", "status")
+# Numeric fields summed per stage
+COUNT_FIELDS = ("bytes", "tables", "rows")
+
+logger = logging.getLogger("scrape.metrics")
+
+def _label_key(fields):
+    return tuple((name, str(fields[name])) for name in LABEL_FIELDS if fields.get(name) is not None)
+
+# Per-stage timings for the scraper.
+# Each finished stage is logged as one JSON line on the "scrape.metrics"
+# logger and folded into in-memory aggregates (count/sum/max seconds plus
+# bytes/tables/rows totals per stage and label set), so memory stays flat in
+# long-running processes. Aggregates export as JSON or Prometheus text.
+class ScrapeMetrics:
+    def __init__(self, run_id=None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._stages = {}
+
+    # Time a block; the yielded dict can be filled with extra fields
+    @contextmanager
+    def stage(self, name, **fields):
+        start = time.perf_counter()
+        try:
+            yield fields
+        finally:
+            self.observe(name, time.perf_counter() - start, **fields)
+
+    # Record an already measured stage
+    def observe(self, name, seconds, **fields):
+        key = (name, _label_key(fields))
+        with self._lock:
+            agg = self._stages.get(key)
+            if agg is None:
+                agg = self._stages[key] = {"count": 0, "seconds_sum": 0.0, "seconds_max": 0.0}
+            agg["count"] += 1
+            agg["seconds_sum"] += seconds
+            agg["seconds_max"] = max(agg["seconds_max"], seconds)
+            for field in COUNT_FIELDS:
+                if fields.get(field) is not None:
+                    agg[f"{field}_sum"] = agg.get(f"{field}_sum", 0) + fields[field]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({"run": self.run_id, "stage": name, "seconds": round(seconds, 6), **fields},
+                                   default=str))
+
+    def summary(self):
+        with self._lock:
+            items = [(name, dict(labels), dict(agg)) for (name, labels), agg in self._stages.items()]
+        return {
+            "run": self.run_id,
+            "started_at": self.started_at,
+            "stages": [{"stage": name, "labels": labels, **agg} for name, labels, agg in items],
+        }
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2)
+
+    def to_prometheus(self):
+        families = {
+            "scrape_stage_seconds": ("summary", "Wall time spent in each scraper stage.", []),
+            "scrape_stage_seconds_max": ("gauge", "Slowest single run of each stage.", []),
+        }
+        for field in COUNT_FIELDS:
+            families[f"scrape_{field}_total"] = ("counter", f"Total {field} handled per stage.", [])
+        for entry in self.summary()["stages"]:
+            labels = {"stage": entry["stage"], **entry["labels"]}
+            label_text = "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+            samples = families["scrape_stage_seconds"][2]
+            samples.append(f"scrape_stage_seconds_sum{label_text} {entry['seconds_sum']:.6f}")
+            samples.append(f"scrape_stage_seconds_count{label_text} {entry['count']}")
+            families["scrape_stage_seconds_max"][2].append(
+                f"scrape_stage_seconds_max{label_text} {entry['seconds_max']:.6f}")
+            for field in COUNT_FIELDS:
+                if f"{field}_sum" in entry:
+                    families[f"scrape_{field}_total"][2].append(
+                        f"scrape_{field}_total{label_text} {entry[f'{field}_sum']}")
+
+        lines = []
+        for name, (kind, help_text, samples) in families.items():
+            if samples:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    # .json writes the JSON summary, anything else Prometheus text
+    def write(self, path):
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+# Process-wide metrics used by ranking_scrapper
+METRICS = ScrapeMetrics()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+import os
+import gzip
+import queue
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+
+# zstd compresses HTML smaller and faster than gzip; gzip is the fallback
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_DIR = "snapshots"
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+CODEC_SUFFIXES = {"zstd": ".html.zst", "gzip": ".html.gz"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    url          TEXT    NOT NULL,
+    fetched_at   TEXT    NOT NULL,
+    digest       TEXT    NOT NULL,
+    codec        TEXT    NOT NULL,
+    raw_bytes    INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_url_time ON snapshots (url, fetched_at);
+CREATE INDEX IF NOT EXISTS snapshots_time ON snapshots (fetched_at);
+"""
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+def _compress(data, codec):
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _decompress(data, codec):
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+# Compressed, content-addressed archive of rendered pages.
+# Objects live under objects/<2-char prefix>/<sha256>, so a page that did not
+# change since the last scrape is stored once; every fetch still gets an index
+# row (url, fetched_at) in index.sqlite. submit() only enqueues: hashing,
+# compression and disk writes happen on a background writer thread.
+class SnapshotArchive:
+    def __init__(self, root=ARCHIVE_DIR, codec=None):
+        self.root = root
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        if self.codec == "zstd" and zstandard is None:
+            raise RuntimeError("The zstd codec needs zstandard (pip install zstandard)")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.index_path = os.path.join(root, "index.sqlite")
+        with sqlite3.connect(self.index_path) as conn:
+            conn.executescript(SCHEMA)
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest, codec):
+        return os.path.join(self.root, "objects", digest[:2], digest + CODEC_SUFFIXES[codec])
+
+    # Queue a page for archiving; returns immediately
+    def submit(self, url, html, fetched_at=None):
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="snapshot-writer", daemon=True)
+                self._writer.start()
+        self._queue.put((url, html, fetched_at or _now()))
+
+    def _write_loop(self):
+        conn = sqlite3.connect(self.index_path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    self._queue.task_done()
+                    break
+                try:
+                    self._store(conn, *item)
+                except Exception:
+                    logging.exception("Failed to archive snapshot of %s", item[0])
+                finally:
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _store(self, conn, url, html, fetched_at):
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, self.codec)
+        if os.path.exists(path):
+            stored_bytes = os.path.getsize(path)
+        else:
+            blob = _compress(data, self.codec)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+            stored_bytes = len(blob)
+        with conn:
+            conn.execute(
+                "INSERT INTO snapshots (url, fetched_at, digest, codec, raw_bytes, stored_bytes)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (url, fetched_at, digest, self.codec, len(data), stored_bytes),
+            )
+        logging.debug("Archived %s (%d -> %d bytes)", url, len(data), stored_bytes)
+
+    # Block until everything submitted so far is on disk
+    def flush(self):
+        self._queue.join()
+
+    # Stop the writer thread after draining the queue
+    def close(self):
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Index rows matching the filters, oldest first. url is one URL or a list of them.
+    def entries(self, url=None, since=None, until=None, latest_only=False):
+        clauses, params = [], []
+        if url is not None:
+            urls = [url] if isinstance(url, str) else list(url)
+            clauses.append(f"url IN ({', '.join('?' * len(urls))})")
+            params.extend(urls)
+        if since is not None:
+            clauses.append("fetched_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("fetched_at < ?")
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        if latest_only:
+            query = ("SELECT url, MAX(fetched_at), digest, codec FROM snapshots"
+                     f"{where} GROUP BY url ORDER BY url")
+        else:
+            query = f"SELECT url, fetched_at, digest, codec FROM snapshots{where} ORDER BY fetched_at, id"
+        with sqlite3.connect(self.index_path) as conn:
+            return conn.execute(query, params).fetchall()
+
+    # Stream (url, fetched_at, html) back, decompressing one object at a time
+    def iter_snapshots(self, url=None, since=None, until=None, latest_only=False):
+        for entry_url, fetched_at, digest, codec in self.entries(url, since, until, latest_only):
+            with open(self._object_path(digest, codec), "rb") as f:
+                html = _decompress(f.read(), codec).decode("utf-8")
+            yield entry_url, fetched_at, html
+
+    # Raw vs stored bytes, and how many fetches were deduplicated
+    def stats(self):
+        with sqlite3.connect(self.index_path) as conn:
+            fetches, raw_bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0) FROM snapshots").fetchone()
+            objects, stored_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(stored_bytes), 0)"
+                " FROM (SELECT digest, MAX(stored_bytes) AS stored_bytes FROM snapshots GROUP BY digest)"
+            ).fetchone()
+        return {"fetches": fetches, "objects": objects, "raw_bytes": raw_bytes, "stored_bytes": stored_bytes}
@@ -0,0 +1,177 @@
+# ============================================
+# 🤖 Rule-based vs ML vs Feature-Engineered ML
+# Author: AI Classroom Demo
+# ============================================
+
+import hashlib
+import importlib
+import numpy as np
+from .rule_engine import ODD_EVEN
+
+# ------------------------------------------------
+# 🧮 1. RULE-BASED APPROACH — Deterministic Logic
+# ------------------------------------------------
+def rule_based_odd_even(numbers):
+    return ODD_EVEN.label_list(numbers)
+
+
+# ------------------------------------------------
+# ⚙️ SHARED: vectorized features + fit-once model cache
+# ------------------------------------------------
+# Prediction codes: 0 = Odd, 1 = Even (LABELS[codes] gives the strings)
+LABELS = np.array(["Odd", "Even"])
+# sklearn is imported on first fit, not when this module loads
+MODELS = {
+    "logistic": ("sklearn.linear_model", "LogisticRegression"),
+    "tree": ("sklearn.tree", "DecisionTreeClassifier"),
+}
+FEATURE_MODES = ("naive", "mod")
+
+# Fitted estimators keyed by (model, feature mode, training data hash)
+_FIT_CACHE = {}
+
+
+def as_numbers(numbers):
+    return np.asarray(numbers, dtype=np.int64).ravel()
+
+
+def parity_features(numbers, mode="naive"):
+    numbers = as_numbers(numbers)
+    if mode == "naive":
+        return numbers.reshape(-1, 1)
+    if mode == "mod":
+        return (numbers & 1).astype(np.int8).reshape(-1, 1)
+    raise ValueError(f"Unknown feature mode {mode!r}, expected one of {FEATURE_MODES}")
+
+
+def parity_targets(numbers):
+    return ((as_numbers(numbers) & 1) ^ 1).astype(np.int8)
+
+
+def data_fingerprint(numbers):
+    return hashlib.sha256(np.ascontiguousarray(as_numbers(numbers)).tobytes()).hexdigest()
+
+
+def to_labels(codes):
+    return LABELS[np.asarray(codes)]
+
+
+def make_estimator(model):
+    module, name = MODELS[model]
+    return getattr(importlib.import_module(module), name)()
+
+
+# Odd/even classifier: trains once per (model, features, data), predicts whole arrays at once.
+# With a ModelStore, a fit missing from the in-process cache is loaded from disk
+# before training, and new fits are saved there.
+class ParityClassifier:
+    def __init__(self, model="logistic", features="naive", store=None):
+        if model not in MODELS:
+            raise ValueError(f"Unknown model {model!r}, expected one of {tuple(MODELS)}")
+        if features not in FEATURE_MODES:
+            raise ValueError(f"Unknown feature mode {features!r}, expected one of {FEATURE_MODES}")
+        self.model = model
+        self.features = features
+        self.store = store
+        self.estimator = None
+
+    def fit(self, train_numbers):
+        key = (self.model, self.features, data_fingerprint(train_numbers))
+        estimator = _FIT_CACHE.get(key)
+        if estimator is None:
+            X, y = parity_features(train_numbers, self.features), parity_targets(train_numbers)
+            if self.store is not None:
+                estimator = self.store.fit_or_load(make_estimator(self.model), X, y)
+            else:
+                estimator = make_estimator(self.model).fit(X, y)
+            _FIT_CACHE[key] = estimator
+        self.estimator = estimator
+        return self
+
+    # int8 codes, 1 = Even
+    def predict(self, numbers):
+        if self.estimator is None:
+            raise RuntimeError("ParityClassifier.predict called before fit")
+        return self.estimator.predict(parity_features(numbers, self.features)).astype(np.int8)
+
+    def predict_labels(self, numbers):
+        return to_labels(self.predict(numbers))
+
+
+def _predict_labels(model, features, train_numbers, test_numbers, store):
+    return ParityClassifier(model, features, store).fit(train_numbers).predict_labels(test_numbers).tolist()
+
+
+# ------------------------------------------------
+# 🧠 2. LOGISTIC REGRESSION (Naive)
+# ------------------------------------------------
+def logistic_regression_naive(train_numbers, test_numbers, store=None):
+    return _predict_labels("logistic", "naive", train_numbers, test_numbers, store)
+
+
+# ------------------------------------------------
+# 🧠 3. LOGISTIC REGRESSION (with Feature Engineering)
+# ------------------------------------------------
+def logistic_regression_mod_feature(train_numbers, test_numbers, store=None):
+    return _predict_labels("logistic", "mod", train_numbers, test_numbers, store)
+
+
+# ------------------------------------------------
+# 🌳 4. DECISION TREE (Naive vs Feature Engineered)
+# ------------------------------------------------
+def decision_tree_naive(train_numbers, test_numbers, store=None):
+    return _predict_labels("tree", "naive", train_numbers, test_numbers, store)
+
+
+def decision_tree_mod_feature(train_numbers, test_numbers, store=None):
+    return _predict_labels("tree", "mod", train_numbers, test_numbers, store)
+
+
+# ------------------------------------------------
+# 🧪 DEMO RUN
+# ------------------------------------------------
+def main():
+    from .model_store import ModelStore
+
+    store = ModelStore()
+    train_numbers = list(range(1, 21))
+    test_numbers = [21, 22, 23, 24]
+
+    print("\n==========================")
+    print(" RULE-BASED SYSTEM")
+    print("==========================")
+    rb_results = rule_based_odd_even(test_numbers)
+    for n, r in zip(test_numbers, rb_results):
+        print(f"{n} ➝ {r}")
+
+    print("\n==========================")
+    print(" LOGISTIC REGRESSION (Naive)")
+    print("==========================")
+    lr_naive = logistic_regression_naive(train_numbers, test_numbers, store)
+    for n, r in zip(test_numbers, lr_naive):
+        print(f"{n} ➝ {r}")
+
+    print("\n==========================")
+    print(" LOGISTIC REGRESSION (Mod Feature)")
+    print("==========================")
+    lr_mod = logistic_regression_mod_feature(train_numbers, test_numbers, store)
+    for n, r in zip(test_numbers, lr_mod):
+        print(f"{n} ➝ {r}")
+
+    print("\n==========================")
+    print(" DECISION TREE (Naive)")
+    print("==========================")
+    dt_naive = decision_tree_naive(train_numbers, test_numbers, store)
+    for n, r in zip(test_numbers, dt_naive):
+        print(f"{n} ➝ {r}")
+
+    print("\n==========================")
+    print(" DECISION TREE (Mod Feature)")
+    print("==========================")
+    dt_mod = decision_tree_mod_feature(train_numbers, test_numbers, store)
+    for n, r in zip(test_numbers, dt_mod):
+        print(f"{n} ➝ {r}")
+
+
+if __name__ == "__main__":
+    main()
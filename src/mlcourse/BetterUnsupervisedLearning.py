@@ -0,0 +1,222 @@
+import os
+import numpy as np
+
+# Customer data [Age, Spending Score]
+customers = np.array([
+    [18, 90], [19, 88], [20, 85], [23, 80], [25, 77],
+    [30, 60], [35, 65], [40, 55], [45, 52], [50, 50],
+    [55, 40], [60, 42], [65, 39], [70, 35], [75, 30]
+])
+
+FEATURES = ("age", "spending_score")
+# Segment names ordered by cluster center spending score, lowest first
+SEGMENT_NAMES = ["🧓 Older Low Spenders", "🧑 Middle-Age Moderate Spenders", "👦 Young High Spenders"]
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SAMPLE_SIZE = 50_000
+
+
+# Cluster id -> segment code, where code 0 is the lowest-spending center
+def segment_order(centers):
+    order = np.argsort(centers[:, 1])
+    codes = np.empty(len(order), dtype=np.int8)
+    codes[order] = np.arange(len(order))
+    return codes
+
+
+def segment_names(n_clusters):
+    if n_clusters == len(SEGMENT_NAMES):
+        return list(SEGMENT_NAMES)
+    return [f"Segment {i}" for i in range(n_clusters)]
+
+
+# ------------------------------------------------
+# 📥 Chunked input: CSV, Parquet or an in-memory array
+# ------------------------------------------------
+def iter_customer_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE, columns=FEATURES):
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), chunk_size):
+            yield np.ascontiguousarray(source[start:start + chunk_size], dtype=np.float32)
+    elif str(source).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=list(columns)):
+            yield np.column_stack([batch.column(name).to_numpy() for name in columns]).astype(np.float32)
+    else:
+        import pandas as pd
+
+        dtypes = {name: np.float32 for name in columns}
+        for frame in pd.read_csv(source, usecols=list(columns), dtype=dtypes, chunksize=chunk_size):
+            yield frame[list(columns)].to_numpy(dtype=np.float32)
+
+
+# Uniform sample of up to size rows across all chunks: keep the rows with the smallest random keys
+class ReservoirSample:
+    def __init__(self, size, random_state=0):
+        self.size = size
+        self.rng = np.random.default_rng(random_state)
+        self.keys = np.empty(0)
+        self.rows = None
+
+    def add(self, chunk):
+        keys = np.concatenate([self.keys, self.rng.random(len(chunk))])
+        rows = chunk if self.rows is None else np.concatenate([self.rows, chunk])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            keys, rows = keys[keep], rows[keep]
+        self.keys, self.rows = keys, rows
+
+
+# ------------------------------------------------
+# 🧩 Fit: MiniBatchKMeans.partial_fit over every chunk
+# ------------------------------------------------
+def fit_segments(source, n_clusters=3, chunk_size=DEFAULT_CHUNK_SIZE, epochs=1,
+                 sample_size=DEFAULT_SAMPLE_SIZE, random_state=0):
+    from sklearn.cluster import MiniBatchKMeans
+
+    model = MiniBatchKMeans(n_clusters=n_clusters, random_state=random_state, n_init=3)
+    sample = ReservoirSample(sample_size, random_state)
+    for epoch in range(epochs):
+        for chunk in iter_customer_chunks(source, chunk_size):
+            # partial_fit needs at least n_clusters rows to initialize
+            if len(chunk) >= n_clusters or hasattr(model, "cluster_centers_"):
+                model.partial_fit(chunk)
+            if epoch == 0:
+                sample.add(chunk)
+    return model, sample.rows
+
+
+def assign_segments(model, chunk):
+    return segment_order(model.cluster_centers_)[model.predict(chunk)]
+
+
+# Stream label codes out chunk by chunk (.parquet or CSV); returns rows written
+def write_segments(source, model, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    import pandas as pd
+
+    names = segment_names(model.n_clusters)
+    writer = None
+    rows = 0
+    if os.path.exists(output) and not output.endswith(".parquet"):
+        os.remove(output)
+    try:
+        for chunk in iter_customer_chunks(source, chunk_size):
+            frame = pd.DataFrame(chunk, columns=list(FEATURES))
+            frame["segment"] = pd.Categorical.from_codes(assign_segments(model, chunk), names)
+            if output.endswith(".parquet"):
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output, table.schema)
+                writer.write_table(table)
+            else:
+                frame.to_csv(output, mode="a", header=rows == 0, index=False)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+# ------------------------------------------------
+# 📏 Quality: mini-batch model vs full KMeans on the sample
+# ------------------------------------------------
+def compare_with_full_kmeans(model, sample, random_state=0):
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import adjusted_rand_score
+
+    full = KMeans(n_clusters=model.n_clusters, random_state=random_state, n_init=3).fit(sample)
+    minibatch_labels = assign_segments(model, sample)
+    full_labels = segment_order(full.cluster_centers_)[full.labels_]
+    minibatch_inertia = -model.score(sample)
+    return {
+        "sample_rows": len(sample),
+        "minibatch_inertia": float(minibatch_inertia),
+        "full_inertia": float(full.inertia_),
+        "inertia_ratio": float(minibatch_inertia / full.inertia_) if full.inertia_ else None,
+        "adjusted_rand": float(adjusted_rand_score(full_labels, minibatch_labels)),
+        "label_agreement": float(np.mean(full_labels == minibatch_labels)),
+    }
+
+
+# Pick the number of segments with a parallel k sweep over a uniform sample
+def choose_clusters(source, chunk_size=DEFAULT_CHUNK_SIZE, sample_size=DEFAULT_SAMPLE_SIZE, k_values=range(2, 9)):
+    from .k_selection import select_k, print_report
+
+    sample = ReservoirSample(sample_size)
+    for chunk in iter_customer_chunks(source, chunk_size):
+        sample.add(chunk)
+    _, report = select_k(sample.rows, k_values)
+    print_report(report)
+    return report["best_k"]
+
+
+# Synthetic customers around the three demo segments, for trying the pipeline at scale
+def make_customers(n, random_state=0):
+    rng = np.random.default_rng(random_state)
+    centers = np.array([[21, 84], [40, 56], [65, 37]], dtype=np.float32)
+    picks = rng.integers(0, len(centers), size=n)
+    return (centers[picks] + rng.normal(0, 4, size=(n, 2))).astype(np.float32)
+
+
+def demo():
+    import matplotlib.pyplot as plt
+    from sklearn.cluster import KMeans
+
+    # Run K-Means
+    kmeans = KMeans(n_clusters=3, random_state=0)
+    labels = kmeans.fit_predict(customers)
+
+    # Sort cluster centers by spending score (second column) to name them
+    codes = segment_order(kmeans.cluster_centers_)[labels]
+    names = np.array(SEGMENT_NAMES)[codes]
+
+    # Print labeled results
+    for i, name in enumerate(names):
+        print(f"Customer {i+1}: Age={customers[i,0]}, Spending={customers[i,1]} ➝ {name}")
+
+    # Plot clusters
+    plt.figure(figsize=(7,5))
+    plt.scatter(customers[:, 0], customers[:, 1], c=labels, cmap='viridis', s=120)
+    plt.scatter(kmeans.cluster_centers_[:, 0], kmeans.cluster_centers_[:, 1],
+                c='red', s=200, marker='X', label='Cluster Centers')
+    plt.title("🛍️ Customer Segmentation (K-Means)")
+    plt.xlabel("Age")
+    plt.ylabel("Spending Score")
+    plt.legend()
+    plt.show()
+
+
+def main(argv=None):
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Segment customers by age and spending score.")
+    parser.add_argument("source", nargs="?", help="CSV or Parquet with age,spending_score; omit for the demo")
+    parser.add_argument("--output", help="write age, spending_score, segment here (.csv or .parquet)")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="segment N generated customers instead")
+    parser.add_argument("--clusters", default="3", help="number of segments, or auto to sweep k on a sample")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--sample-size", type=int, default=DEFAULT_SAMPLE_SIZE)
+    args = parser.parse_args(argv)
+
+    source = make_customers(args.synthetic) if args.synthetic else args.source
+    if source is None:
+        demo()
+        return
+    n_clusters = choose_clusters(source, args.chunk_size, args.sample_size) if args.clusters == "auto" \
+        else int(args.clusters)
+    model, sample = fit_segments(source, n_clusters, args.chunk_size, args.epochs, args.sample_size)
+    centers = model.cluster_centers_[np.argsort(model.cluster_centers_[:, 1])]
+    for name, center in zip(segment_names(n_clusters), centers):
+        print(f"{name}: Age≈{center[0]:.1f}, Spending≈{center[1]:.1f}")
+    print(json.dumps(compare_with_full_kmeans(model, sample), indent=2))
+    if args.output:
+        rows = write_segments(source, model, args.output, args.chunk_size)
+        print(f"Wrote {rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,14 +13,12 @@
 # pip install transformers
 
 # ---------------------------------------------------------
-# 2️⃣ IMPORT LIBRARIES
-# ---------------------------------------------------------
-from transformers import pipeline
-
-# ---------------------------------------------------------
-# 3️⃣ TEXT GENERATION DEMO (TINY MODEL)
+# 2️⃣ TEXT GENERATION DEMO (TINY MODEL)
 # ---------------------------------------------------------
 def text_generation_demo():
+    # transformers (and torch) load only when the demo runs
+    from transformers import pipeline
+
     print("\n🧠 TEXT GENERATION DEMO (Tiny Model)\n")
     
     # Use small model for low memory usage
@@ -33,12 +31,15 @@ def text_generation_demo():
     print("\n✨ Generated Text:\n", result[0]['generated_text'])
 
 # ---------------------------------------------------------
-# 4️⃣ MAIN EXECUTION
+# 3️⃣ MAIN EXECUTION
 # ---------------------------------------------------------
-if __name__ == "__main__":
+def main():
     print("="*50)
     print(" 🚀 CPU-FRIENDLY GENERATIVE AI DEMO — TEXT ONLY ")
     print("="*50)
 
     # Run text generation
     text_generation_demo()
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,43 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
+from .model_store import ModelStore
 
-# Sample data: numbers from 0 to 9
-X = np.arange(0, 10).reshape(-1, 1)   # Features (0,1,2,...9)
-y = np.array([0 if i % 2 == 0 else 1 for i in X.flatten()])  # Labels: 0 = even, 1 = odd
 
-# Split train & test
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+def main():
+    import matplotlib.pyplot as plt
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import train_test_split
 
-# Train Logistic Regression model
-model = LogisticRegression()
-model.fit(X_train, y_train)
+    # Sample data: numbers from 0 to 9
+    X = np.arange(0, 10).reshape(-1, 1)   # Features (0,1,2,...9)
+    y = np.array([0 if i % 2 == 0 else 1 for i in X.flatten()])  # Labels: 0 = even, 1 = odd
 
-# Predict on test set
-y_pred = model.predict(X_test)
-y_prob = model.predict_proba(X_test)
+    # Split train & test
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
 
-print("Test labels:", y_test)
-print("Predicted labels:", y_pred)
-print("Predicted probabilities:\n", y_prob)
+    # Train Logistic Regression model (or load the saved one)
+    model = ModelStore().fit_or_load(LogisticRegression(), X_train, y_train)
 
-# Plot the sigmoid curve
-x_range = np.linspace(-1, 10, 200).reshape(-1, 1)
-y_sigmoid = model.predict_proba(x_range)[:, 1]  # Probability of class '1' (odd)
+    # Predict on test set
+    y_pred = model.predict(X_test)
+    y_prob = model.predict_proba(X_test)
 
-plt.figure(figsize=(8, 5))
-plt.scatter(X_train, y_train, c='blue', label='Train Data', marker='o')
-plt.scatter(X_test, y_test, c='red', label='Test Data', marker='x')  # Black cross here 🔸
-plt.plot(x_range, y_sigmoid, color='black', label='Sigmoid Curve')
-plt.axhline(0.5, color='gray', linestyle='--', label='Decision Boundary (0.5)')
-plt.xlabel('Number')
-plt.ylabel('Probability (Odd)')
-plt.legend()
-plt.show()
+    print("Test labels:", y_test)
+    print("Predicted labels:", y_pred)
+    print("Predicted probabilities:\n", y_prob)
 
+    # Plot the sigmoid curve
+    x_range = np.linspace(-1, 10, 200).reshape(-1, 1)
+    y_sigmoid = model.predict_proba(x_range)[:, 1]  # Probability of class '1' (odd)
+
+    plt.figure(figsize=(8, 5))
+    plt.scatter(X_train, y_train, c='blue', label='Train Data', marker='o')
+    plt.scatter(X_test, y_test, c='red', label='Test Data', marker='x')  # Black cross here 🔸
+    plt.plot(x_range, y_sigmoid, color='black', label='Sigmoid Curve')
+    plt.axhline(0.5, color='gray', linestyle='--', label='Decision Boundary (0.5)')
+    plt.xlabel('Number')
+    plt.ylabel('Probability (Odd)')
+    plt.legend()
+    plt.show()
 
 
 # numpy → for numerical arrays.
@@ -89,4 +91,8 @@ plt.show()
 
 # 👉 The black/red cross mark (marker='x') simply represents the test data points. We use a different shape to visually distinguish between train and test data.
     #Points below the 0.5 line → classified as even (0)
-    #Points above → classified as odd (1).
\ No newline at end of file
+    #Points above → classified as odd (1).
+
+
+if __name__ == "__main__":
+    main()
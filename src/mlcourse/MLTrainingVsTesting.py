@@ -1,44 +1,46 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, r2_score
-import pandas as pd
 
-data = {'Size': [1000, 1500, 1800, 2400, 3000],
-        'Price': [200000, 250000, 280000, 350000, 400000]}
-df = pd.DataFrame(data)
-X = df[['Size']]
-y = df['Price']
 
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+def main():
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    from sklearn.model_selection import train_test_split
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_squared_error, r2_score
 
-model = LinearRegression()
-model.fit(X_train, y_train)
+    data = {'Size': [1000, 1500, 1800, 2400, 3000],
+            'Price': [200000, 250000, 280000, 350000, 400000]}
+    df = pd.DataFrame(data)
+    X = df[['Size']]
+    y = df['Price']
 
-print("Coef:", model.coef_)
-print("Intercept:", model.intercept_)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-y_pred = model.predict(X_test)
-mse = mean_squared_error(y_test, y_pred)
-rmse = np.sqrt(mse)
-r2 = r2_score(y_test, y_pred)
+    model = LinearRegression()
+    model.fit(X_train, y_train)
 
-print("y_test:", y_test.values)
-print("y_pred:", y_pred)
-print("MSE:", mse, "RMSE:", rmse, "R2:", r2)
+    print("Coef:", model.coef_)
+    print("Intercept:", model.intercept_)
 
-# Plot training points and best-fit line
-plt.scatter(X_train, y_train, color='blue', label='Train')
-plt.scatter(X_test, y_test, color='green', label='Test')
-xs = np.linspace(X.min(), X.max(), 100).reshape(-1, 1)
-plt.plot(xs, model.predict(xs), color='red', label='Fit')
-plt.legend()
-plt.xlabel('Size (sqft)')
-plt.ylabel('Price ($)')
-plt.title('Linear Regression Demo')
-plt.show()
+    y_pred = model.predict(X_test)
+    mse = mean_squared_error(y_test, y_pred)
+    rmse = np.sqrt(mse)
+    r2 = r2_score(y_test, y_pred)
 
+    print("y_test:", y_test.values)
+    print("y_pred:", y_pred)
+    print("MSE:", mse, "RMSE:", rmse, "R2:", r2)
+
+    # Plot training points and best-fit line
+    plt.scatter(X_train, y_train, color='blue', label='Train')
+    plt.scatter(X_test, y_test, color='green', label='Test')
+    xs = np.linspace(X.min(), X.max(), 100).reshape(-1, 1)
+    plt.plot(xs, model.predict(xs), color='red', label='Fit')
+    plt.legend()
+    plt.xlabel('Size (sqft)')
+    plt.ylabel('Price ($)')
+    plt.title('Linear Regression Demo')
+    plt.show()
 
 
 # train_test_split: utility to split data into training and testing sets.
@@ -86,4 +88,8 @@ plt.show()
 
 # MSE = average of squared differences between actual and predicted values:
     # Lower MSE → better fit.
-    # With tiny test set (1 sample) MSE is not a stable metric — use larger test sets or cross-validation for real evaluation
\ No newline at end of file
+    # With tiny test set (1 sample) MSE is not a stable metric — use larger test sets or cross-validation for real evaluation
+
+
+if __name__ == "__main__":
+    main()
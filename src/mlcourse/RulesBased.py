@@ -0,0 +1,21 @@
+from .rule_engine import ODD_EVEN
+
+# ---- Rule-based system ----
+def rule_based_classifier(number):
+    if number % 2 == 0:
+        return "Even"
+    else:
+        return "Odd"
+
+# Many numbers at once: one vectorized pass, codes index ODD_EVEN.labels
+def rule_based_classify_many(numbers):
+    return ODD_EVEN.codes(numbers)
+
+# Demo
+def main():
+    numbers = [1, 2, 3, 4, 5, 6]
+    for n, code in zip(numbers, rule_based_classify_many(numbers)):
+        print(f"{n} ➝ {ODD_EVEN.labels[code]}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import numpy as np
+from .model_store import ModelStore
+
+# ---- Training data ----
+# X = numbers, y = labels (0 = Odd, 1 = Even)
+X = np.array([[1], [2], [3], [4], [5], [6], [7], [8]])
+y = np.array([0, 1, 0, 1, 0, 1, 0, 1])
+
+
+# ---- Train model (or load the saved one) ----
+def train_model(store=None):
+    from sklearn.linear_model import LogisticRegression
+
+    return (store or ModelStore()).fit_or_load(LogisticRegression(), X, y)
+
+
+def main():
+    model = train_model()
+
+    # ---- Predict ----
+    test_numbers = np.array([[9], [10], [11], [12]])
+    predictions = model.predict(test_numbers)
+
+    for num, pred in zip(test_numbers.flatten(), predictions):
+        label = "Even" if pred == 1 else "Odd"
+        print(f"{num} ➝ {label}")
+
+
+if __name__ == "__main__":
+    main()
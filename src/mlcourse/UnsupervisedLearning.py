@@ -0,0 +1,26 @@
+import numpy as np
+from .model_store import ModelStore
+
+# ---- Data ----
+X = np.array([[1], [2], [3], [10], [11], [12]])
+
+
+# ---- KMeans Clustering (or load the saved model) ----
+def train_model(store=None):
+    from sklearn.cluster import KMeans
+
+    return (store or ModelStore()).fit_or_load(KMeans(n_clusters=2, random_state=0), X)
+
+
+def main():
+    kmeans = train_model()
+
+    # ---- Predict Cluster ----
+    clusters = kmeans.predict(X)
+
+    for num, cluster in zip(X.flatten(), clusters):
+        print(f"{num} ➝ Cluster {cluster}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# ============================================
+# 📦 mlcourse — the course's ML demos as one importable package
+# ============================================
+# Importing the package (or any module in it) only pulls in NumPy;
+# sklearn, matplotlib, torch and transformers load inside the functions
+# that use them. Demos run from the command line:
+#   python -m mlcourse                       # list demos
+#   python -m mlcourse BetterSupervisedLearning
+#   python -m mlcourse.stream_classify numbers.txt --engine tree_mod
+
+import importlib
+
+# Public names -> module that defines them, imported on first access
+_EXPORTS = {
+    "ParityClassifier": "BetterSupervisedLearning",
+    "rule_based_odd_even": "BetterSupervisedLearning",
+    "LABELS": "BetterSupervisedLearning",
+    "RuleEngine": "rule_engine",
+    "ODD_EVEN": "rule_engine",
+    "ModelStore": "model_store",
+    "classify_stream": "stream_classify",
+    "write_stream": "stream_classify",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
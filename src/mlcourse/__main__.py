@@ -0,0 +1,27 @@
+# python -m mlcourse <demo> [args...]: run one module of the package as a script
+import os
+import sys
+import runpy
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def demos():
+    return sorted(name[:-3] for name in os.listdir(PACKAGE_DIR)
+                  if name.endswith(".py") and not name.startswith("_"))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in demos():
+        print("usage: python -m mlcourse <demo> [args...]\n\ndemos:")
+        for name in demos():
+            print(f"  {name}")
+        return 0 if not argv else 2
+    sys.argv = [f"mlcourse.{argv[0]}"] + argv[1:]
+    runpy.run_module(f"mlcourse.{argv[0]}", run_name="__main__", alter_sys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+# ============================================
+# ⏱️ Benchmark: rule-based vs ML odd/even classifiers
+# ============================================
+# Runs rule_based_odd_even and every model function from
+# BetterSupervisedLearning over growing inputs and records fit time, predict
+# throughput, p50/p99 single-item latency, peak memory and accuracy:
+#   python -m mlcourse.bench_classifiers --output bench_classifiers.json
+#   python -m mlcourse.bench_classifiers --compare bench_classifiers.json --output run2.csv
+
+import gc
+import csv
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+import numpy as np
+from . import BetterSupervisedLearning as bsl
+
+APPROACHES = {
+    "rule_based": None,
+    "logistic_naive": ("logistic", "naive", bsl.logistic_regression_naive),
+    "logistic_mod": ("logistic", "mod", bsl.logistic_regression_mod_feature),
+    "tree_naive": ("tree", "naive", bsl.decision_tree_naive),
+    "tree_mod": ("tree", "mod", bsl.decision_tree_mod_feature),
+}
+DEFAULT_SIZES = "10,100,1000,10000,100000,1000000,10000000"
+CSV_FIELDS = ("approach", "size", "fit_s", "predict_s", "items_per_s", "p50_us", "p99_us", "peak_bytes", "accuracy")
+
+
+def _predict_fn(approach, train_numbers):
+    if APPROACHES[approach] is None:
+        return bsl.rule_based_odd_even
+    return lambda numbers: APPROACHES[approach][2](train_numbers, numbers)
+
+
+# Best of repeat runs for one fresh fit (in-process fit cache cleared each time)
+def time_fit(approach, train_numbers, repeat):
+    if APPROACHES[approach] is None:
+        return 0.0
+    model, features, _ = APPROACHES[approach]
+    best = float("inf")
+    for _ in range(repeat):
+        bsl._FIT_CACHE.clear()
+        start = time.perf_counter()
+        bsl.ParityClassifier(model, features).fit(train_numbers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Per-call latency percentiles for one-item inputs, in microseconds
+def single_item_latency(predict, numbers, samples):
+    timings = np.empty(samples, dtype=np.float64)
+    for i in range(samples):
+        item = [int(numbers[i % len(numbers)])]
+        start = time.perf_counter_ns()
+        predict(item)
+        timings[i] = time.perf_counter_ns() - start
+    return np.percentile(timings, 50) / 1000, np.percentile(timings, 99) / 1000
+
+
+def peak_bytes(fn):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_approach(approach, numbers, train_numbers, repeat, latency_samples, measure_memory):
+    predict = _predict_fn(approach, train_numbers)
+    fit_s = time_fit(approach, train_numbers, repeat)
+    predict(numbers[:1])  # warm the fit cache so predict timings exclude training
+
+    best, labels = float("inf"), None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        labels = predict(numbers)
+        best = min(best, time.perf_counter() - start)
+
+    truth = np.where(numbers % 2 == 0, "Even", "Odd")
+    p50, p99 = single_item_latency(predict, numbers, latency_samples)
+    return {
+        "approach": approach,
+        "size": len(numbers),
+        "fit_s": fit_s,
+        "predict_s": best,
+        "items_per_s": len(numbers) / best if best else None,
+        "p50_us": p50,
+        "p99_us": p99,
+        "peak_bytes": peak_bytes(lambda: predict(numbers)) if measure_memory else None,
+        "accuracy": float(np.mean(np.asarray(labels) == truth)),
+    }
+
+
+def run(sizes, approaches, train_size, repeat, latency_samples, measure_memory, seed):
+    import sklearn
+
+    rng = np.random.default_rng(seed)
+    train_numbers = list(range(1, train_size + 1))
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sklearn": sklearn.__version__,
+        "train_size": train_size,
+        "results": [],
+    }
+    for size in sizes:
+        numbers = rng.integers(0, 10**9, size=size, dtype=np.int64)
+        for approach in approaches:
+            report["results"].append(
+                bench_approach(approach, numbers, train_numbers, repeat, latency_samples, measure_memory))
+    return report
+
+
+def print_report(report, baseline=None):
+    base = {(r["approach"], r["size"]): r for r in (baseline or {}).get("results", [])}
+    print(f"{'approach':<16}{'size':>10}{'fit ms':>9}{'items/s':>14}{'p50 us':>9}{'p99 us':>9}"
+          f"{'peak MiB':>10}{'acc':>7}{'vs base':>9}")
+    for r in report["results"]:
+        peak = f"{r['peak_bytes'] / 2**20:>10.1f}" if r["peak_bytes"] is not None else f"{'-':>10}"
+        line = (f"{r['approach']:<16}{r['size']:>10}{r['fit_s'] * 1000:>9.2f}{r['items_per_s'] or 0:>14.0f}"
+                f"{r['p50_us']:>9.1f}{r['p99_us']:>9.1f}{peak}{r['accuracy']:>7.3f}")
+        previous = base.get((r["approach"], r["size"]))
+        if previous:
+            line += f"{r['predict_s'] / previous['predict_s']:>8.2f}x"
+        print(line)
+
+
+# .csv writes one row per (approach, size), anything else the JSON report
+def save_report(report, path):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(report["results"])
+        else:
+            json.dump(report, f, indent=2)
+
+
+def load_report(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        if not path.endswith(".csv"):
+            return json.load(f)
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row["size"] = int(row["size"])
+        row["predict_s"] = float(row["predict_s"])
+    return {"results": rows}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the odd/even classifiers.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated input sizes")
+    parser.add_argument("--approaches", default=",".join(APPROACHES),
+                        help=f"comma-separated subset of {', '.join(APPROACHES)}")
+    parser.add_argument("--train-size", type=int, default=20, help="train on 1..N like the demo")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-samples", type=int, default=1000)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON, or CSV for *.csv")
+    parser.add_argument("--compare", metavar="PATH", help="show predict time relative to a saved run")
+    args = parser.parse_args()
+
+    approaches = args.approaches.split(",")
+    unknown = set(approaches) - set(APPROACHES)
+    if unknown:
+        parser.error(f"unknown approaches: {', '.join(sorted(unknown))}")
+    report = run([int(float(size)) for size in args.sizes.split(",")], approaches, args.train_size,
+                 args.repeat, args.latency_samples, not args.no_memory, args.seed)
+    print_report(report, load_report(args.compare) if args.compare else None)
+    if args.output:
+        save_report(report, args.output)
@@ -0,0 +1,131 @@
+# ============================================
+# 🔍 Automatic k for K-Means: parallel sweep with elbow + silhouette
+# ============================================
+# Every (k, seed) pair is one KMeans fit in a process pool. The data is sent
+# to each worker once (pool initializer), each worker's BLAS/OpenMP is pinned
+# to one thread so processes don't oversubscribe the cores, and tasks are
+# submitted largest k first so the slowest fits never straggle at the end.
+# Silhouette is computed on a random sample (full silhouette is O(n²)).
+#
+#   model, report = select_k(X, k_values=range(2, 11), seeds=(0, 1, 2))
+
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+DEFAULT_K_VALUES = range(2, 11)
+DEFAULT_SEEDS = (0, 1, 2)
+# Sampled silhouette is O(sample²): 5000 rows ≈ 0.4s, 10000 ≈ 1.5s per fit
+SILHOUETTE_SAMPLE = 5_000
+
+# Per-worker copy of the data, set once by the pool initializer
+_X = None
+
+
+def _init_worker(X):
+    global _X
+    _X = X
+
+
+def _fit_one(k, seed, silhouette_sample, X=None):
+    from sklearn.cluster import KMeans
+    from sklearn.metrics import silhouette_score
+    from threadpoolctl import threadpool_limits
+
+    X = _X if X is None else X
+    start = time.perf_counter()
+    with threadpool_limits(limits=1):
+        model = KMeans(n_clusters=k, random_state=seed, n_init=1).fit(X)
+        sample_size = min(silhouette_sample, len(X))
+        silhouette = float(silhouette_score(X, model.labels_, sample_size=sample_size, random_state=seed))
+    # predict() only needs the centers; don't ship an n-row label array back
+    del model.labels_
+    return {
+        "k": k,
+        "seed": seed,
+        "inertia": float(model.inertia_),
+        "silhouette": silhouette,
+        "n_iter": int(model.n_iter_),
+        "seconds": time.perf_counter() - start,
+        "model": model,
+    }
+
+
+# k at the knee of the inertia curve: farthest point from the first-to-last chord
+def elbow_k(ks, inertias):
+    ks = np.asarray(ks, dtype=np.float64)
+    inertias = np.asarray(inertias, dtype=np.float64)
+    if len(ks) < 3:
+        return int(ks[0])
+    x = (ks - ks[0]) / (ks[-1] - ks[0])
+    span = inertias[0] - inertias[-1]
+    y = (inertias - inertias[-1]) / span if span else np.zeros_like(inertias)
+    return int(ks[np.argmax(np.abs(1 - x - y))])
+
+
+def sweep_k(X, k_values=DEFAULT_K_VALUES, seeds=DEFAULT_SEEDS, workers=None, silhouette_sample=SILHOUETTE_SAMPLE):
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    ks = sorted({k for k in k_values if 2 <= k < len(X)})
+    if not ks:
+        raise ValueError(f"No usable k in {list(k_values)} for {len(X)} rows")
+    # Largest k first: the longest fits start early and short ones fill the gaps
+    tasks = [(k, seed) for k in reversed(ks) for seed in seeds]
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+
+    if workers == 1:
+        return [_fit_one(k, seed, silhouette_sample, X) for k, seed in tasks]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(X,)) as pool:
+        futures = [pool.submit(_fit_one, k, seed, silhouette_sample) for k, seed in tasks]
+        return [future.result() for future in as_completed(futures)]
+
+
+# Best seed per k by inertia, then the k with the highest silhouette
+def select_k(X, k_values=DEFAULT_K_VALUES, seeds=DEFAULT_SEEDS, workers=None, silhouette_sample=SILHOUETTE_SAMPLE):
+    start = time.perf_counter()
+    fits = sweep_k(X, k_values, seeds, workers, silhouette_sample)
+    best_per_k = {}
+    for fit in fits:
+        best = best_per_k.get(fit["k"])
+        if best is None or fit["inertia"] < best["inertia"]:
+            best_per_k[fit["k"]] = fit
+    ks = sorted(best_per_k)
+    best = max(best_per_k.values(), key=lambda fit: fit["silhouette"])
+    report = {
+        "best_k": best["k"],
+        "elbow_k": elbow_k(ks, [best_per_k[k]["inertia"] for k in ks]),
+        "wall_seconds": time.perf_counter() - start,
+        "fit_seconds": sum(fit["seconds"] for fit in fits),
+        "results": [{key: value for key, value in fit.items() if key != "model"}
+                    for fit in sorted(fits, key=lambda fit: (fit["k"], fit["seed"]))],
+    }
+    return best["model"], report
+
+
+def print_report(report):
+    print(f"{'k':>3}{'seed':>6}{'inertia':>16}{'silhouette':>12}{'iters':>7}{'seconds':>9}")
+    for row in report["results"]:
+        print(f"{row['k']:>3}{row['seed']:>6}{row['inertia']:>16.1f}{row['silhouette']:>12.4f}"
+              f"{row['n_iter']:>7}{row['seconds']:>9.2f}")
+    print(f"best k (silhouette): {report['best_k']}, elbow k: {report['elbow_k']}, "
+          f"wall {report['wall_seconds']:.2f}s for {report['fit_seconds']:.2f}s of fits")
+
+
+if __name__ == "__main__":
+    import argparse
+    from .BetterUnsupervisedLearning import iter_customer_chunks, make_customers
+
+    parser = argparse.ArgumentParser(description="Pick k for K-Means with a parallel sweep.")
+    parser.add_argument("source", nargs="?", help="CSV or Parquet with age,spending_score")
+    parser.add_argument("--synthetic", type=int, metavar="N", default=100_000)
+    parser.add_argument("--k-min", type=int, default=2)
+    parser.add_argument("--k-max", type=int, default=10)
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--silhouette-sample", type=int, default=SILHOUETTE_SAMPLE)
+    args = parser.parse_args()
+
+    X = np.concatenate(list(iter_customer_chunks(args.source))) if args.source else make_customers(args.synthetic)
+    _, report = select_k(X, range(args.k_min, args.k_max + 1), range(args.seeds), args.workers,
+                         args.silhouette_sample)
+    print_report(report)
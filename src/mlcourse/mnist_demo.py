@@ -0,0 +1,267 @@
+import os
+import gzip
+import time
+import random
+import numpy as np
+from .model_store import ModelStore, data_fingerprint
+
+BATCH_SIZE = 64
+EPOCHS = 5
+LR = 0.001
+DATA_MODES = ("memmap", "torchvision")
+MNIST_FILES = {
+    True: ("train-images-idx3-ubyte", "train-labels-idx1-ubyte"),
+    False: ("t10k-images-idx3-ubyte", "t10k-labels-idx1-ubyte"),
+}
+# IDX type byte 0x08 = unsigned byte, the only type MNIST uses
+IDX_UBYTE = 0x08
+
+# ========================
+# STEP 1a: IDX files -> memory-mapped uint8 arrays (decoded once)
+# ========================
+def read_idx(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        data = f.read()
+    if data[0] != 0 or data[1] != 0 or data[2] != IDX_UBYTE:
+        raise ValueError(f"{path} is not an unsigned-byte IDX file")
+    ndim = data[3]
+    shape = tuple(int(d) for d in np.frombuffer(data, dtype=">u4", count=ndim, offset=4))
+    return np.frombuffer(data, dtype=np.uint8, offset=4 + 4 * ndim).reshape(shape)
+
+
+# Decode raw/<name>[.gz] to cache/<name>.npy on first use, then memory-map it
+def cached_idx(raw_dir, cache_dir, name):
+    cache_path = os.path.join(cache_dir, name + ".npy")
+    if not os.path.exists(cache_path):
+        raw_path = os.path.join(raw_dir, name)
+        if not os.path.exists(raw_path):
+            raw_path += ".gz"
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, np.ascontiguousarray(read_idx(raw_path)))
+        os.replace(tmp_path, cache_path)
+    return np.load(cache_path, mmap_mode="r")
+
+
+# MNIST served as whole batches sliced from the memory-mapped cache.
+# Indexing with a list of indices returns one normalized (B, 1, 28, 28)
+# float batch, so a DataLoader with a BatchSampler and batch_size=None skips
+# per-sample PIL -> tensor conversion; an int index returns one (1, 28, 28)
+# image like torchvision's MNIST does.
+class MemmapMNIST:
+    def __init__(self, root="data", train=True):
+        images_name, labels_name = MNIST_FILES[train]
+        raw_dir = os.path.join(root, "MNIST", "raw")
+        cache_dir = os.path.join(root, "MNIST", "memmap")
+        self.data = cached_idx(raw_dir, cache_dir, images_name)
+        # int64 like torchvision's targets, so model artifacts fingerprint the same in both modes
+        self.targets = np.asarray(cached_idx(raw_dir, cache_dir, labels_name), dtype=np.int64)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        import torch
+
+        if isinstance(index, (int, np.integer)):
+            image = torch.from_numpy(np.array(self.data[index], dtype=np.float32))
+            return image.div_(255).unsqueeze(0), int(self.targets[index])
+        # Sorted indices read the memory map in file order; batch order doesn't matter for SGD
+        index = np.sort(np.asarray(index))
+        images = torch.from_numpy(np.asarray(self.data[index])).float().div_(255).unsqueeze(1)
+        return images, torch.from_numpy(self.targets[index])
+
+
+def _has_raw_files(root):
+    raw_dir = os.path.join(root, "MNIST", "raw")
+    names = [name for pair in MNIST_FILES.values() for name in pair]
+    return all(os.path.exists(os.path.join(raw_dir, name)) or os.path.exists(os.path.join(raw_dir, name + ".gz"))
+               for name in names)
+
+# ========================
+# STEP 1: Load MNIST Data
+# ========================
+def load_data(root="data", mode="memmap", num_workers=0):
+    from torchvision import datasets, transforms
+    from torch.utils.data import DataLoader, BatchSampler, RandomSampler, SequentialSampler
+
+    if mode not in DATA_MODES:
+        raise ValueError(f"Unknown data mode {mode!r}, expected one of {DATA_MODES}")
+    workers = {"num_workers": num_workers, "persistent_workers": num_workers > 0}
+
+    if mode == "memmap":
+        if not _has_raw_files(root):
+            # Let torchvision download the raw IDX files once
+            for train in (True, False):
+                datasets.MNIST(root=root, train=train, download=True)
+        train_dataset = MemmapMNIST(root, train=True)
+        test_dataset = MemmapMNIST(root, train=False)
+        train_loader = DataLoader(
+            train_dataset,
+            sampler=BatchSampler(RandomSampler(train_dataset), BATCH_SIZE, drop_last=False),
+            batch_size=None,
+            **workers,
+        )
+        test_loader = DataLoader(
+            test_dataset,
+            sampler=BatchSampler(SequentialSampler(test_dataset), BATCH_SIZE, drop_last=False),
+            batch_size=None,
+            **workers,
+        )
+    else:
+        transform = transforms.ToTensor()
+
+        train_dataset = datasets.MNIST(
+            root=root,
+            train=True,
+            transform=transform,
+            download=True
+        )
+        test_dataset = datasets.MNIST(
+            root=root,
+            train=False,
+            transform=transform,
+            download=True
+        )
+        train_loader = DataLoader(train_dataset, batch_size=BATCH_SIZE, shuffle=True, **workers)
+        test_loader = DataLoader(test_dataset, batch_size=BATCH_SIZE, shuffle=False, **workers)
+
+    print(f"Train size: {len(train_dataset)}, Test size: {len(test_dataset)}")
+    return train_dataset, test_dataset, train_loader, test_loader
+
+# ========================
+# STEP 2: Visualize Samples
+# ========================
+def show_samples(loader):
+    import matplotlib.pyplot as plt
+
+    images, labels = next(iter(loader))
+    plt.figure(figsize=(10,2))
+    for i in range(6):
+        plt.subplot(1,6,i+1)
+        plt.imshow(images[i].squeeze(), cmap='gray')
+        plt.title(f"Label: {labels[i]}")
+        plt.axis('off')
+    plt.show()
+
+# ========================
+# STEP 3: Define Neural Network
+# ========================
+def build_model():
+    from torch import nn
+
+    class NeuralNet(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.flatten = nn.Flatten()
+            self.fc1 = nn.Linear(28*28, 128)
+            self.fc2 = nn.Linear(128, 64)
+            self.fc3 = nn.Linear(64, 10)
+            self.relu = nn.ReLU()
+
+        def forward(self, x):
+            x = self.flatten(x)
+            x = self.relu(self.fc1(x))
+            x = self.relu(self.fc2(x))
+            x = self.fc3(x)
+            return x
+
+    return NeuralNet()
+
+# ========================
+# STEP 4 + 5: Loss, Optimizer and Training Loop
+# ========================
+def train(model, train_loader, epochs=EPOCHS):
+    import torch
+    from torch import nn
+
+    loss_fn = nn.CrossEntropyLoss()
+    optimizer = torch.optim.Adam(model.parameters(), lr=LR)
+
+    for epoch in range(epochs):
+        total_loss = 0
+        seen = 0
+        start = time.perf_counter()
+        for images, labels in train_loader:
+            outputs = model(images)
+            loss = loss_fn(outputs, labels)
+
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+
+            total_loss += loss.item()
+            seen += len(labels)
+        avg_loss = total_loss / len(train_loader)
+        rate = seen / (time.perf_counter() - start)
+        print(f"Epoch [{epoch+1}/{epochs}] - Loss: {avg_loss:.4f} - {rate:.0f} images/s")
+
+# Saved weights are reused when present, otherwise train and save
+def train_or_load(model, train_dataset, train_loader, store=None):
+    import torch
+
+    return (store or ModelStore()).train_or_load(
+        model,
+        params={"epochs": EPOCHS, "lr": LR, "batch_size": BATCH_SIZE, "torch": torch.__version__},
+        fingerprint=data_fingerprint(train_dataset.data, train_dataset.targets),
+        train=lambda: train(model, train_loader),
+    )
+
+# ========================
+# STEP 6: Evaluation
+# ========================
+def evaluate(model, test_loader):
+    import torch
+
+    correct = 0
+    total = 0
+    with torch.no_grad():
+        for images, labels in test_loader:
+            outputs = model(images)
+            _, predicted = torch.max(outputs, 1)
+            total += labels.size(0)
+            correct += (predicted == labels).sum().item()
+
+    accuracy = 100 * correct / total
+    print(f"Test Accuracy: {accuracy:.2f}%")
+    return accuracy
+
+# ========================
+# STEP 7: Test on Single Image
+# ========================
+def show_prediction(model, test_dataset):
+    import torch
+    import matplotlib.pyplot as plt
+
+    idx = random.randint(0, len(test_dataset)-1)
+    img, label = test_dataset[idx]
+    with torch.no_grad():
+        output = model(img.unsqueeze(0))
+        pred = output.argmax(1).item()
+
+    plt.imshow(img.squeeze(), cmap='gray')
+    plt.title(f"Predicted: {pred}, Actual: {label}")
+    plt.axis('off')
+    plt.show()
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train a small MNIST classifier.")
+    parser.add_argument("--root", default="data")
+    parser.add_argument("--data-mode", choices=DATA_MODES, default="memmap",
+                        help="memmap: decoded uint8 cache sliced per batch; torchvision: per-sample ToTensor")
+    parser.add_argument("--num-workers", type=int, default=0, help="DataLoader workers (persistent when > 0)")
+    args = parser.parse_args(argv)
+
+    train_dataset, test_dataset, train_loader, test_loader = load_data(args.root, args.data_mode, args.num_workers)
+    show_samples(train_loader)
+    model = build_model()
+    print(model)
+    train_or_load(model, train_dataset, train_loader)
+    evaluate(model, test_loader)
+    show_prediction(model, test_dataset)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# ============================================
+# 💾 Model artifact store — load if present, else train and save
+# ============================================
+# Fitted sklearn estimators are saved with joblib (uncompressed, so their
+# NumPy arrays can be memory-mapped back instead of copied), PyTorch modules
+# as state_dicts. Every artifact is keyed by model type, hyperparameters,
+# library version and a fingerprint of the training data, so changing any of
+# them trains a fresh model instead of loading a stale one.
+#
+#   ML_ARTIFACTS=path  -> where artifacts live (default: ./artifacts)
+#   ML_RETRAIN=1       -> ignore saved artifacts, train and overwrite
+
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+
+ARTIFACT_DIR = os.environ.get("ML_ARTIFACTS", "artifacts")
+
+
+def _as_array(data):
+    if hasattr(data, "detach"):
+        data = data.detach().cpu().numpy()
+    return np.ascontiguousarray(np.asarray(data))
+
+
+# SHA-256 over dtype, shape and raw bytes of every array passed in
+def data_fingerprint(*arrays):
+    digest = hashlib.sha256()
+    for data in arrays:
+        if data is None:
+            digest.update(b"none\0")
+            continue
+        array = _as_array(data)
+        digest.update(f"{array.dtype.str}{array.shape}\0".encode("ascii"))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def artifact_key(model_type, params, fingerprint):
+    spec = json.dumps({"model": model_type, "params": params}, sort_keys=True, default=repr)
+    return hashlib.sha256(f"{spec}\0{fingerprint}".encode("utf-8")).hexdigest()[:32]
+
+
+class ModelStore:
+    def __init__(self, root=ARTIFACT_DIR, retrain=None):
+        self.root = root
+        self.retrain = os.environ.get("ML_RETRAIN") == "1" if retrain is None else retrain
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key, suffix):
+        return os.path.join(self.root, key + suffix)
+
+    @staticmethod
+    def _replace(tmp_path, path):
+        os.replace(tmp_path, path)
+        logging.info("Saved model artifact %s", path)
+
+    # ---------------- sklearn ----------------
+    def estimator_key(self, estimator, X, y=None):
+        import sklearn
+
+        model_type = f"{type(estimator).__module__}.{type(estimator).__name__}"
+        params = {"params": estimator.get_params(deep=False), "sklearn": sklearn.__version__}
+        return artifact_key(model_type, params, data_fingerprint(X, y))
+
+    def load_estimator(self, key, mmap=True):
+        import joblib
+
+        path = self.path(key, ".joblib")
+        if self.retrain or not os.path.exists(path):
+            return None
+        return joblib.load(path, mmap_mode="r" if mmap else None)
+
+    def save_estimator(self, key, estimator):
+        import joblib
+
+        path = self.path(key, ".joblib")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        # compress=0 keeps arrays as raw buffers that mmap_mode can map
+        joblib.dump(estimator, tmp_path, compress=0)
+        self._replace(tmp_path, path)
+
+    # Load the estimator trained on (X, y) with the same params, or fit and save it
+    def fit_or_load(self, estimator, X, y=None):
+        key = self.estimator_key(estimator, X, y)
+        loaded = self.load_estimator(key)
+        if loaded is not None:
+            logging.info("Loaded %s from %s", type(estimator).__name__, self.root)
+            return loaded
+        if y is None:
+            estimator.fit(X)
+        else:
+            estimator.fit(X, y)
+        self.save_estimator(key, estimator)
+        return estimator
+
+    # ---------------- PyTorch ----------------
+    def load_module(self, module, key):
+        import torch
+
+        path = self.path(key, ".pt")
+        if self.retrain or not os.path.exists(path):
+            return False
+        try:
+            state = torch.load(path, map_location="cpu", weights_only=True, mmap=True)
+        except TypeError:
+            # torch < 2.1 has no mmap/weights_only
+            state = torch.load(path, map_location="cpu")
+        module.load_state_dict(state)
+        logging.info("Loaded %s from %s", type(module).__name__, path)
+        return True
+
+    def save_module(self, module, key):
+        import torch
+
+        path = self.path(key, ".pt")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        torch.save(module.state_dict(), tmp_path)
+        self._replace(tmp_path, path)
+
+    # Load module weights if present, else call train() and save the result
+    def train_or_load(self, module, params, fingerprint, train):
+        key = artifact_key(type(module).__name__, params, fingerprint)
+        if self.load_module(module, key):
+            return module
+        train()
+        self.save_module(module, key)
+        return module
@@ -0,0 +1,125 @@
+# ============================================
+# 📏 Vectorized rule engine
+# ============================================
+# Rules are NumPy predicates over an int64 array (parity via bitwise ops,
+# half-open ranges, thresholds, conjunctions). An engine applies an ordered
+# rule list in one pass over the input: it walks the array in cache-sized
+# blocks, evaluates every rule into reused scratch buffers, and writes int8
+# category codes. The first matching rule wins; codes index the engine's
+# label table, so no per-item Python runs and no strings are built.
+#
+#   engine = RuleEngine([("small", InRange(0, 10)), ("even", Parity(0))], default="other")
+#   codes = engine.codes(numbers)        # int8 array
+#   engine.labels[codes]                 # strings, only if you need them
+
+import operator
+import numpy as np
+
+# 64K int64 values = 512 KiB: each block stays in cache while all rules run
+BLOCK_SIZE = 1 << 16
+# Code for inputs no rule matched when the engine has no default
+NO_MATCH = -1
+
+
+# x % 2 == remainder, using x & 1 (also right for negative numbers)
+class Parity:
+    def __init__(self, remainder=0):
+        self.remainder = remainder & 1
+
+    def evaluate(self, x, scratch, out):
+        # The low bit lands straight in the bool mask, no int64 temporary
+        np.bitwise_and(x, 1, out=out, casting="unsafe")
+        return out if self.remainder else np.logical_not(out, out=out)
+
+
+# low <= x < high, as a single unsigned compare: (x - low) mod 2**64 < high - low
+class InRange:
+    def __init__(self, low, high):
+        if high < low:
+            raise ValueError(f"Empty range [{low}, {high})")
+        self.low = np.int64(low)
+        self.width = np.uint64(high - low)
+
+    def evaluate(self, x, scratch, out):
+        with np.errstate(over="ignore"):
+            np.subtract(x, self.low, out=scratch)
+        return np.less(scratch.view(np.uint64), self.width, out=out)
+
+
+class Threshold:
+    OPS = {">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal,
+           "==": np.equal, "!=": np.not_equal}
+
+    def __init__(self, op, value):
+        if op not in self.OPS:
+            raise ValueError(f"Unknown comparison {op!r}, expected one of {tuple(self.OPS)}")
+        self.op = op
+        self.value = np.int64(value)
+
+    def evaluate(self, x, scratch, out):
+        return self.OPS[self.op](x, self.value, out=out)
+
+
+# Every rule must match
+class All:
+    def __init__(self, *rules):
+        if not rules:
+            raise ValueError("All() needs at least one rule")
+        self.rules = rules
+
+    def evaluate(self, x, scratch, out):
+        self.rules[0].evaluate(x, scratch, out)
+        mask = np.empty_like(out)
+        for rule in self.rules[1:]:
+            operator.iand(out, rule.evaluate(x, scratch, mask))
+        return out
+
+
+class RuleEngine:
+    def __init__(self, rules, default=None):
+        self.rules = [rule for _, rule in rules]
+        labels = [label for label, _ in rules] + ([default] if default is not None else [])
+        if len(labels) > np.iinfo(np.int8).max:
+            raise ValueError(f"At most {np.iinfo(np.int8).max} labels fit int8 codes")
+        self.labels = np.array(labels)
+        self.default_code = len(self.rules) if default is not None else NO_MATCH
+
+    # int8 codes into self.labels for every input number
+    def codes(self, numbers, block_size=BLOCK_SIZE):
+        x = np.asarray(numbers, dtype=np.int64).ravel()
+        codes = np.empty(len(x), dtype=np.int8)
+        scratch = np.empty(min(block_size, len(x)), dtype=np.int64)
+        mask = np.empty(len(scratch), dtype=bool)
+        for start in range(0, len(x), block_size):
+            xb = x[start:start + block_size]
+            out = codes[start:start + block_size]
+            n = len(xb)
+            if not self.rules:
+                out.fill(self.default_code)
+                continue
+            # Lowest-priority rule sets every code arithmetically (default + mask * delta),
+            # then earlier rules overwrite where they match, so the first match wins
+            last = len(self.rules) - 1
+            matched = self.rules[last].evaluate(xb, scratch[:n], mask[:n])
+            np.multiply(matched, last - self.default_code, out=out, casting="unsafe")
+            if self.default_code:
+                np.add(out, self.default_code, out=out, casting="unsafe")
+            for code in range(last - 1, -1, -1):
+                matched = self.rules[code].evaluate(xb, scratch[:n], mask[:n])
+                np.copyto(out, code, where=matched)
+        return codes
+
+    # (codes, label table) pair, the categorical form of the result
+    def classify(self, numbers):
+        return self.codes(numbers), self.labels
+
+    # Plain list of labels; unmatched inputs become None
+    def label_list(self, numbers):
+        table = self.labels
+        if self.default_code == NO_MATCH:
+            table = np.append(table.astype(object), None)
+        return table[self.codes(numbers)].tolist()
+
+
+# The course's rule: codes 0 = Odd, 1 = Even (same as BetterSupervisedLearning.LABELS)
+ODD_EVEN = RuleEngine([("Odd", Parity(1))], default="Even")
@@ -0,0 +1,134 @@
+# ============================================
+# 🌊 Streaming odd/even classification with flat memory
+# ============================================
+# Numbers come from any iterable, a NumPy array, a .npy file (memory-mapped)
+# or a text file of whitespace-separated integers ("-" = stdin). They are read
+# in fixed-size chunks into int64 buffers, each chunk is classified in one
+# vectorized call, and results are yielded or written out chunk by chunk, so
+# memory depends on the chunk size, never on the input size:
+#   python -m mlcourse.stream_classify numbers.txt --engine tree_mod --output labels.csv
+
+import os
+import sys
+import argparse
+import itertools
+import numpy as np
+from . import BetterSupervisedLearning as bsl
+from .rule_engine import ODD_EVEN
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Rough bytes per number in text input, used to size file reads
+TEXT_BYTES_PER_NUMBER = 12
+ENGINES = {
+    "rule": None,
+    "logistic_naive": ("logistic", "naive"),
+    "logistic_mod": ("logistic", "mod"),
+    "tree_naive": ("tree", "naive"),
+    "tree_mod": ("tree", "mod"),
+}
+
+
+def _iter_text_blocks(f, block_bytes):
+    tail = b""
+    while True:
+        block = f.read(block_bytes)
+        if not block:
+            break
+        block = tail + block
+        # Keep a number split across reads for the next block
+        cut = max(block.rfind(b" "), block.rfind(b"\n"), block.rfind(b"\t"))
+        if cut < 0:
+            tail = block
+            continue
+        block, tail = block[:cut], block[cut + 1:]
+        if block.strip():
+            yield np.fromstring(block, dtype=np.int64, sep=" ")
+    if tail.strip():
+        yield np.fromstring(tail, dtype=np.int64, sep=" ")
+
+
+# A read block holds however many numbers fit in its bytes, so re-slice the
+# parsed blocks into chunk_size pieces and carry the remainder over
+def _iter_text_chunks(f, chunk_size):
+    pending = np.empty(0, dtype=np.int64)
+    for block in _iter_text_blocks(f, chunk_size * TEXT_BYTES_PER_NUMBER):
+        if len(pending):
+            block = np.concatenate([pending, block])
+        full = len(block) - len(block) % chunk_size
+        for start in range(0, full, chunk_size):
+            yield block[start:start + chunk_size]
+        pending = block[full:]
+    if len(pending):
+        yield pending
+
+
+def _iter_array_chunks(array, chunk_size):
+    for start in range(0, len(array), chunk_size):
+        yield np.asarray(array[start:start + chunk_size], dtype=np.int64)
+
+
+# int64 chunks of at most chunk_size numbers from any supported source
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path == "-":
+            yield from _iter_text_chunks(sys.stdin.buffer, chunk_size)
+        elif path.endswith(".npy"):
+            yield from _iter_array_chunks(np.load(path, mmap_mode="r").ravel(), chunk_size)
+        else:
+            with open(path, "rb") as f:
+                yield from _iter_text_chunks(f, chunk_size)
+    elif isinstance(source, np.ndarray):
+        yield from _iter_array_chunks(source.ravel(), chunk_size)
+    else:
+        iterator = iter(source)
+        while True:
+            chunk = np.fromiter(itertools.islice(iterator, chunk_size), dtype=np.int64)
+            if not len(chunk):
+                break
+            yield chunk
+
+
+# Chunk -> int8 codes (1 = Even) for the chosen engine
+def make_classifier(engine="rule", train_numbers=range(1, 21), store=None):
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {tuple(ENGINES)}")
+    if ENGINES[engine] is None:
+        return ODD_EVEN.codes
+    model, features = ENGINES[engine]
+    return bsl.ParityClassifier(model, features, store).fit(list(train_numbers)).predict
+
+
+# Yield (numbers, codes) pairs chunk by chunk
+def classify_stream(source, engine="rule", chunk_size=DEFAULT_CHUNK_SIZE, train_numbers=range(1, 21), store=None):
+    classify = make_classifier(engine, train_numbers, store)
+    for chunk in iter_chunks(source, chunk_size):
+        yield chunk, classify(chunk)
+
+
+# Write "number,label" lines as chunks are classified; returns the number of rows
+def write_stream(source, out, engine="rule", chunk_size=DEFAULT_CHUNK_SIZE, train_numbers=range(1, 21), store=None):
+    rows = 0
+    for numbers, codes in classify_stream(source, engine, chunk_size, train_numbers, store):
+        lines = map("{},{}\n".format, numbers.tolist(), bsl.to_labels(codes).tolist())
+        out.write("".join(lines))
+        rows += len(numbers)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Classify a stream of integers as odd/even in chunks.")
+    parser.add_argument("source", help="text file of integers, .npy file, or - for stdin")
+    parser.add_argument("--engine", choices=ENGINES, default="rule")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--train-size", type=int, default=20, help="model engines train on 1..N")
+    parser.add_argument("--output", default="-", help="CSV path, or - for stdout")
+    args = parser.parse_args()
+
+    train_numbers = range(1, args.train_size + 1)
+    if args.output == "-":
+        write_stream(args.source, sys.stdout, args.engine, args.chunk_size, train_numbers)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            rows = write_stream(args.source, f, args.engine, args.chunk_size, train_numbers)
+        print(f"Wrote {rows} rows to {args.output}", file=sys.stderr)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+import json
+import sqlite3
+import logging
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+STANDINGS_DB = "standings.sqlite"
+KEY_COLUMNS = ["table_index", "team"]
+VALUE_COLUMNS = ["rank", "points", "nrr", "won"]
+CHANGE_COLUMNS = [
+    "league", "table_index", "team", "change",
+    "rank", "prev_rank", "rank_delta", "points", "prev_points",
+    "nrr", "prev_nrr", "won", "prev_won",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS standings (
+    league      TEXT    NOT NULL,
+    table_index INTEGER NOT NULL,
+    team        TEXT    NOT NULL,
+    rank        INTEGER,
+    points      REAL,
+    nrr         REAL,
+    won         REAL,
+    updated_at  TEXT    NOT NULL,
+    PRIMARY KEY (league, table_index, team)
+)
+"""
+
+UPSERT = """
+INSERT INTO standings (league, table_index, team, rank, points, nrr, won, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (league, table_index, team) DO UPDATE SET
+    rank = excluded.rank, points = excluded.points, nrr = excluded.nrr,
+    won = excluded.won, updated_at = excluded.updated_at
+"""
+
+# float32 columns -> float64 through the shortest float32 repr, so 4.3383 is
+# stored and exported as 4.3383 instead of widening to 4.3383002281188965
+def _widen_floats(frame):
+    narrow = frame.select_dtypes(include=[np.float16, np.float32]).columns
+    if not len(narrow):
+        return frame
+    return frame.assign(**{col: frame[col].to_numpy().astype(str).astype(np.float64) for col in narrow})
+
+# SQLite has no NaN and no numpy scalars: missing numbers become NULL
+def _sql_value(value):
+    if pd.isna(value):
+        return None
+    if isinstance(value, np.floating) and value.itemsize < 8:
+        return float(str(value))
+    return value.item() if isinstance(value, np.generic) else value
+
+# Persistent standings keyed by (league, table_index, team).
+# apply() upserts only the rows whose rank/points/nrr/won changed and returns
+# those changes, so consumers handle a few rows per run instead of the league.
+class StandingsStore:
+    def __init__(self, path=STANDINGS_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Stored standings, optionally for one league
+    def standings(self, league=None):
+        query = "SELECT league, table_index, team, rank, points, nrr, won, updated_at FROM standings"
+        params = ()
+        if league is not None:
+            query += " WHERE league = ?"
+            params = (league,)
+        return pd.read_sql_query(query + " ORDER BY league, table_index, rank", self.conn, params=params)
+
+    # Compare a freshly ranked frame with the stored one and persist the differences
+    def apply(self, df, league, scraped_at=None):
+        if df.empty:
+            return pd.DataFrame(columns=CHANGE_COLUMNS)
+        scraped_at = scraped_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        # Compare at the precision that gets stored, or float32 values never match
+        new = _widen_floats(df[KEY_COLUMNS + VALUE_COLUMNS].copy())
+        new["team"] = new["team"].astype(str)
+        new["table_index"] = new["table_index"].astype(np.int64)
+        old = self.standings(league)[KEY_COLUMNS + VALUE_COLUMNS]
+        # Only tables present in this scrape can lose teams
+        old = old[old["table_index"].isin(new["table_index"].unique())]
+
+        merged = new.merge(old, on=KEY_COLUMNS, how="outer", suffixes=("", "_prev"), indicator=True)
+        merged = merged.rename(columns={f"{col}_prev": f"prev_{col}" for col in VALUE_COLUMNS})
+        added = (merged["_merge"] == "left_only").to_numpy()
+        removed = (merged["_merge"] == "right_only").to_numpy()
+        updated = np.zeros(len(merged), dtype=bool)
+        for col in VALUE_COLUMNS:
+            current = merged[col].to_numpy(dtype=np.float64)
+            previous = merged[f"prev_{col}"].to_numpy(dtype=np.float64)
+            updated |= ~np.isclose(current, previous, rtol=0, atol=1e-6, equal_nan=True)
+        updated &= ~(added | removed)
+
+        merged["change"] = np.select([added, removed], ["new", "removed"], default="updated")
+        changes = merged[added | removed | updated].copy()
+        changes["league"] = league
+        changes["rank_delta"] = changes["prev_rank"] - changes["rank"]  # positive = moved up
+        for col in ("rank", "prev_rank", "rank_delta"):
+            changes[col] = changes[col].astype("Int32")
+
+        self._write(changes, league, scraped_at)
+        changes = changes[CHANGE_COLUMNS].sort_values(["table_index", "rank"], na_position="last")
+        logging.info("League %s: %d new, %d updated, %d removed rows", league,
+                     int(added.sum()), int(updated.sum()), int(removed.sum()))
+        return changes.reset_index(drop=True)
+
+    def _write(self, changes, league, scraped_at):
+        upserts = _widen_floats(changes[changes["change"] != "removed"])
+        removals = changes[changes["change"] == "removed"]
+        with self.conn:
+            self.conn.executemany(UPSERT, [
+                (league, int(row.table_index), row.team, _sql_value(row.rank), _sql_value(row.points),
+                 _sql_value(row.nrr), _sql_value(row.won), scraped_at)
+                for row in upserts.itertuples(index=False)
+            ])
+            self.conn.executemany(
+                "DELETE FROM standings WHERE league = ? AND table_index = ? AND team = ?",
+                [(league, int(row.table_index), row.team) for row in removals.itertuples(index=False)],
+            )
+
+# Rows whose position in the table moved
+def rank_moves(changes):
+    moved = changes[(changes["change"] == "updated") & (changes["rank_delta"].fillna(0) != 0)]
+    return moved[["league", "table_index", "team", "prev_rank", "rank", "rank_delta"]]
+
+# Change set as JSON records (NaN becomes null)
+def changes_to_json(changes, indent=None):
+    changes = _widen_floats(changes)
+    records = changes.astype(object).where(changes.notna(), None).to_dict(orient="records")
+    return json.dumps(records, indent=indent, default=str)
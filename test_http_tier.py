@@ -0,0 +1,75 @@
+# HTTP tier against a local http.server stand-in for CricClubs.
+# http.server sends text/html without a charset, like the case that garbled
+# non-ASCII team names before.
+#
+#   python -m pytest -q test_http_tier.py
+import asyncio
+import functools
+import threading
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import pytest
+import ranking_scrapper as rs
+
+if rs.requests is None:
+    pytest.skip("the HTTP tier needs requests", allow_module_level=True)
+
+TEAM = "Zürich Élan XI"
+TABLE_PAGE = f"""<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>
+<table><tr><th>Team</th><th>Points</th></tr><tr><td>{TEAM}</td><td>6</td></tr></table>
+</body></html>"""
+EMPTY_PAGE = """<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>Loading…</body></html>"""
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+# Records escalations; the page itself is never needed
+class _FakeBrowser:
+    def __init__(self):
+        self.pages = 0
+
+    async def new_page(self):
+        self.pages += 1
+        raise RuntimeError("no browser in tests")
+
+@pytest.fixture(scope="module")
+def site(tmp_path_factory):
+    root = tmp_path_factory.mktemp("site")
+    (root / "table.html").write_bytes(TABLE_PAGE.encode("utf-8"))
+    (root / "empty.html").write_bytes(EMPTY_PAGE.encode("utf-8"))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(root)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def _fetch(url):
+    browser, http = _FakeBrowser(), rs.HttpFetcher()
+    try:
+        result = asyncio.run(rs.fetch_page_async(browser, asyncio.Semaphore(1), url, 10,
+                                                 rs.DEFAULT_READY_STRATEGY, None, http))
+    finally:
+        http.close()
+    return result, browser
+
+def test_http_tier_serves_tables_without_the_browser(site):
+    result, browser = _fetch(f"{site}/table.html")
+    assert result.tier == "http"
+    assert browser.pages == 0
+    assert list(result.df["team"].astype(str)) == [TEAM]
+
+def test_missing_charset_decodes_like_the_browser(site):
+    http = rs.HttpFetcher()
+    try:
+        html = http.fetch(f"{site}/table.html")
+    finally:
+        http.close()
+    assert TEAM in html
+
+@pytest.mark.parametrize("path", ["/missing.html", "/empty.html"])
+def test_escalates_to_browser(site, path):
+    result, browser = _fetch(f"{site}{path}")
+    assert result.tier == "browser"
+    assert browser.pages == 1
+    assert result.df.empty